@@ -114,8 +114,20 @@ async def startup_event():
     else:
         logger.warning("Database connection failed! Some features may not work.")
 
+    # Warm the login browser so the first login does not pay for its launch
+    from services.auth_service import start_login_browser
+    try:
+        await start_login_browser()
+    except Exception as e:
+        logger.warning(f"Could not start login browser: {e}")
+
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("SGE Scraper API shutting down...")
+
+    from services.auth_service import close_login_browser
+    from scraper.async_scraper import close_browser as close_scrape_browser
+    await close_login_browser()
+    await close_scrape_browser()
@@ -19,6 +19,18 @@ class Settings(BaseSettings):
     max_concurrent_pages: int = Field(default=3, alias="MAX_CONCURRENT_PAGES")
     page_timeout_ms: int = Field(default=30000, alias="PAGE_TIMEOUT_MS")
     delay_between_articles_ms: int = Field(default=2000, alias="DELAY_BETWEEN_ARTICLES_MS")
+    scrape_workers: int = Field(
+        default_factory=lambda: min(os.cpu_count() or 1, 4),
+        alias="SCRAPE_WORKERS"
+    )
+    store_raw_json: bool = Field(default=False, alias="STORE_RAW_JSON")
+    # Async Playwright path (not supported on Windows event loops)
+    scrape_async: bool = Field(default=False, alias="SCRAPE_ASYNC")
+    async_concurrency: int = Field(default=8, alias="ASYNC_CONCURRENCY")
+    # Login browser is relaunched after this many logins
+    browser_pool_recycle_after: int = Field(default=50, alias="BROWSER_POOL_RECYCLE_AFTER")
+    # Save a screenshot when login verification cannot find the code input
+    debug_screenshots: bool = Field(default=False, alias="SGE_DEBUG_SCREENSHOTS")
 
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
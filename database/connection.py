@@ -5,6 +5,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from config.settings import settings
+from utils.helpers import json_dumps, json_loads
 from .models import Base
 
 
@@ -12,6 +13,11 @@ _engine = None
 _SessionLocal = None
 
 
+def _json_serializer(obj) -> str:
+    """Serialize JSON/JSONB column values with orjson when installed."""
+    return json_dumps(obj).decode("utf-8")
+
+
 def get_engine():
     """Get or create the database engine."""
     global _engine
@@ -23,6 +29,8 @@ def get_engine():
             max_overflow=10,
             pool_pre_ping=True,
             echo=False,
+            json_serializer=_json_serializer,
+            json_deserializer=json_loads,
         )
     return _engine
 
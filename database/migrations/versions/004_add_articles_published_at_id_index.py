@@ -0,0 +1,25 @@
+"""Add (published_at, id) index to articles for ordered exports
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves ORDER BY published_at DESC, id DESC by a backward index scan
+    op.create_index(
+        'idx_articles_published_at_id', 'articles', ['published_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_articles_published_at_id', table_name='articles')
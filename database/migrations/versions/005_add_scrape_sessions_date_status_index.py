@@ -0,0 +1,29 @@
+"""Add (target_date, status, started_at) index to scrape_sessions
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the latest-completed-session-for-a-date lookup: equality on
+    # target_date and status, newest started_at first by a backward scan
+    op.create_index(
+        'idx_scrape_sessions_date_status_started_at',
+        'scrape_sessions',
+        ['target_date', 'status', 'started_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_scrape_sessions_date_status_started_at', table_name='scrape_sessions')
@@ -1,13 +1,18 @@
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from typing import Optional, List
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime, ForeignKey,
     JSON, UniqueConstraint, Index, Date
 )
-from sqlalchemy.orm import DeclarativeBase, relationship, Mapped, mapped_column
+from sqlalchemy.orm import DeclarativeBase, relationship, Mapped, mapped_column, query_expression
 from sqlalchemy.dialects.postgresql import JSONB
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -18,7 +23,7 @@ class ScrapeSession(Base):
     __tablename__ = "scrape_sessions"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     target_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)  # Tanggal target scraping
     status: Mapped[str] = mapped_column(String(20), default="running")  # running/completed/failed
@@ -33,6 +38,7 @@ class ScrapeSession(Base):
 
     __table_args__ = (
         Index("idx_scrape_sessions_target_date", "target_date"),
+        Index("idx_scrape_sessions_date_status_started_at", "target_date", "status", "started_at"),
     )
 
     def __repr__(self) -> str:
@@ -59,12 +65,15 @@ class Article(Base):
     featured_image_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     read_time: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=utcnow, onupdate=utcnow
     )
     raw_json: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
+    # Prefix of content_text computed in SQL, set by queries using with_expression
+    content_excerpt: Mapped[Optional[str]] = query_expression()
+
     # Relationship to social contents
     social_contents: Mapped[List["SocialContent"]] = relationship(
         "SocialContent", back_populates="article", cascade="all, delete-orphan"
@@ -74,8 +83,18 @@ class Article(Base):
         Index("idx_articles_slug", "slug"),
         Index("idx_articles_category", "category"),
         Index("idx_articles_published_at", "published_at"),
+        Index("idx_articles_published_at_id", "published_at", "id"),
     )
 
+    @property
+    def tags_csv(self) -> str:
+        """Tags as one comma-separated string."""
+        if not self.tags:
+            return ""
+        if isinstance(self.tags, list):
+            return ", ".join(map(str, self.tags))
+        return str(self.tags)
+
     def __repr__(self) -> str:
         return f"<Article(id={self.id}, title={self.title[:50] if self.title else None})>"
 
@@ -98,7 +117,7 @@ class SocialContent(Base):
     position_in_article: Mapped[int] = mapped_column(Integer, default=0)
     screenshot_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     screenshot_source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # 'screenshot' | 'oembed'
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationship to article
     article: Mapped["Article"] = relationship("Article", back_populates="social_contents")
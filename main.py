@@ -19,6 +19,7 @@ load_dotenv()
 from config.settings import settings
 from config.logging_config import setup_logging
 from services.scrape_service import ScrapeService
+from scraper.async_scraper import close_browser as close_scrape_browser
 from services.export_service import ExportService
 from scheduler import create_scheduler
 
@@ -84,11 +85,14 @@ async def run_once(
 
     # Run scrape
     scrape_service = ScrapeService()
-    result = await scrape_service.run_scrape(
-        limit=limit,
-        target_date=target_date,
-        force=force
-    )
+    try:
+        result = await scrape_service.run_scrape(
+            limit=limit,
+            target_date=target_date,
+            force=force
+        )
+    finally:
+        await close_scrape_browser()
 
     logger.info(f"Scrape completed: {result}")
     print(f"\n{'='*50}")
@@ -123,7 +127,10 @@ async def test_single_url(url: str, target_date: date = None) -> None:
     logger.info(f"Testing single URL: {url}")
 
     scrape_service = ScrapeService()
-    result = await scrape_service.scrape_single_article(url, target_date=target_date)
+    try:
+        result = await scrape_service.scrape_single_article(url, target_date=target_date)
+    finally:
+        await close_scrape_browser()
 
     if result:
         print(f"\n{'='*50}")
@@ -277,6 +284,7 @@ async def run_scheduled() -> None:
 
     # Cleanup
     scheduler.stop()
+    await close_scrape_browser()
     logger.info("Scraper shutdown complete")
 
 
@@ -441,7 +449,9 @@ Examples:
         setup_logging(settings.log_level, settings.log_file)
         print(f"Starting SGE Scraper API server on {args.api_host}:{args.api_port}")
         print(f"Swagger UI: http://localhost:{args.api_port}/docs")
-        uvicorn.run("api.main:app", host=args.api_host, port=args.api_port, reload=True)
+        # No reload: with it uvicorn 0.27 installs the Windows Selector loop
+        # policy, on which async Playwright cannot spawn Chromium
+        uvicorn.run("api.main:app", host=args.api_host, port=args.api_port, reload=False)
         sys.exit(0)
     elif args.login:
         asyncio.run(run_manual_login())
@@ -12,7 +12,7 @@ from config.logging_config import get_logger
 from .social_extractor import SocialExtractor, SocialContentData
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleData:
     """Data class for scraped article."""
     sge_id: str
@@ -0,0 +1,226 @@
+"""
+Asynchronous scraper running many articles in one event loop.
+
+Uses one browser with a context per article, so concurrent page loads share
+a process instead of each needing its own worker and browser. The Windows
+asyncio subprocess issues that motivated sync_scraper still apply, so this
+path is opt-in (SCRAPE_ASYNC) and the sync scraper remains the default.
+"""
+import asyncio
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from config.logging_config import get_logger
+from utils.helpers import json_loads
+from .sync_scraper import (
+    BLOCKED_RESOURCE_TYPES,
+    _NEXT_DATA_TEXT_JS,
+    _PAGE_READY_JS,
+    _extract_content_from_json,
+    _extract_social_contents,
+    _has_complete_json,
+    _is_tracker,
+    _parse_article_sync,
+)
+
+logger = get_logger()
+
+# Browser shared by every article scraped in this event loop
+_playwright = None
+_browser = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+
+async def _block_non_essential(route) -> None:
+    """Route handler aborting heavy resources and trackers."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_tracker(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _get_browser():
+    """Get or launch the headless Chromium shared by async scrapes."""
+    global _playwright, _browser, _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+
+    async with _browser_lock:
+        if _browser is not None and _browser.is_connected():
+            return _browser
+
+        if _playwright is None:
+            from playwright.async_api import async_playwright
+            _playwright = await async_playwright().start()
+
+        _browser = await _playwright.chromium.launch(
+            headless=True,
+            args=["--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox"]
+        )
+        return _browser
+
+
+async def close_browser() -> None:
+    """Close the shared browser and stop Playwright."""
+    global _playwright, _browser
+    try:
+        if _browser is not None:
+            await _browser.close()
+        if _playwright is not None:
+            await _playwright.stop()
+    except PlaywrightError as e:
+        logger.debug(f"Error closing browser: {e}")
+    finally:
+        _browser = None
+        _playwright = None
+
+
+async def scrape_article_async(
+    url: str,
+    session_dir: str,
+    base_url: str = "https://www.socialgrowthengineers.com",
+    jitter_ms: int = 0,
+    include_raw_json: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Scrape a single article with the async Playwright API.
+
+    Mirrors scrape_article_sync; parsing, social extraction and screenshot
+    capture are blocking, so they run in a worker thread.
+
+    Args:
+        url: Article URL to scrape
+        session_dir: Path to session directory containing storage_state.json
+        base_url: Base URL of the site
+        jitter_ms: Upper bound of a random delay before navigating
+        include_raw_json: Return the whole __NEXT_DATA__ blob as raw_json
+
+    Returns:
+        Dict with article data or None if failed
+    """
+    logger.info(f"Scraping (async): {url}")
+
+    try:
+        storage_state_file = Path(session_dir) / "storage_state.json"
+        storage_state = str(storage_state_file) if storage_state_file.exists() else None
+
+        browser = await _get_browser()
+        context = await browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            storage_state=storage_state,
+        )
+        await context.route("**/*", _block_non_essential)
+
+        try:
+            page = await context.new_page()
+
+            if jitter_ms:
+                await asyncio.sleep(random.uniform(0, jitter_ms / 1000))
+
+            try:
+                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            except PlaywrightError as e:
+                logger.warning(f"domcontentloaded failed, retrying with load: {e}")
+                await page.goto(url, wait_until="load", timeout=60000)
+
+            try:
+                await page.wait_for_function(_PAGE_READY_JS, timeout=8000)
+            except PlaywrightTimeoutError:
+                pass
+
+            next_data = None
+            try:
+                json_text = await page.evaluate(_NEXT_DATA_TEXT_JS)
+                if json_text:
+                    next_data = json_loads(json_text)
+            except (PlaywrightError, ValueError) as e:
+                logger.warning(f"Could not extract __NEXT_DATA__: {e}")
+
+            extra_content_html = _extract_content_from_json(next_data)
+            html_content = None
+            if not _has_complete_json(next_data, extra_content_html):
+                html_content = await page.content()
+        finally:
+            await context.close()
+
+        return await asyncio.to_thread(
+            _finish_article,
+            url, base_url, next_data, extra_content_html, html_content,
+            include_raw_json,
+        )
+
+    except Exception:
+        logger.exception(f"Error scraping {url}")
+        return None
+
+
+def _finish_article(
+    url: str,
+    base_url: str,
+    next_data: Optional[Dict],
+    extra_content_html: Optional[str],
+    html_content: Optional[str],
+    include_raw_json: bool
+) -> Dict[str, Any]:
+    """Parse a loaded article and capture its social screenshots (blocking)."""
+    from bs4 import BeautifulSoup
+    from config.settings import settings
+    from .social_screenshot import capture_screenshots_for_article
+
+    if html_content is None:
+        article_data = _parse_article_sync(url, None, next_data, base_url, include_raw_json)
+        social_html = extra_content_html
+    else:
+        soup = BeautifulSoup(html_content, "lxml")
+        article_data = _parse_article_sync(url, soup, next_data, base_url, include_raw_json)
+        social_html = "\n".join([part for part in [html_content, extra_content_html] if part])
+
+    article_data["social_contents"] = capture_screenshots_for_article(
+        social_contents=_extract_social_contents(social_html),
+        output_dir=str(settings.screenshots_dir),
+        article_slug=article_data.get("slug", "unknown")
+    )
+
+    logger.info(f"Success: {article_data.get('title', url)[:50]}")
+    return article_data
+
+
+async def scrape_articles_batch_async(
+    urls: List[str],
+    session_dir: str,
+    base_url: str = "https://www.socialgrowthengineers.com",
+    delay_ms: int = 2000,
+    concurrency: Optional[int] = None,
+    include_raw_json: bool = False
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Scrape multiple articles concurrently in this event loop.
+
+    Args:
+        urls: List of article URLs to scrape
+        session_dir: Path to session directory
+        base_url: Base URL of the site
+        delay_ms: Max random delay before each article loads
+        concurrency: Max pages loading at once (default: settings.async_concurrency)
+        include_raw_json: Return the whole __NEXT_DATA__ blob for each article
+
+    Returns:
+        List of article data dicts (or None for failed articles), in input order
+    """
+    if concurrency is None:
+        from config.settings import settings
+        concurrency = settings.async_concurrency
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def scrape_one(url: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await scrape_article_async(
+                url, session_dir, base_url, delay_ms, include_raw_json
+            )
+
+    return await asyncio.gather(*(scrape_one(url) for url in urls))
@@ -0,0 +1,144 @@
+"""Shared HTTP session for embed, oEmbed and thumbnail requests."""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.helpers import json_loads
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Thumbnails are well under this; anything larger is not an image we want
+MAX_DOWNLOAD_BYTES = 20 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+_session = None
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get or create the keep-alive session used by this process.
+
+    Reusing one connection pool avoids a new TCP/TLS handshake for every
+    embed lookup and thumbnail download.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD"],
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": USER_AGENT})
+        _session = session
+    return _session
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body straight from its bytes."""
+    return json_loads(response.content)
+
+
+def content_digest(data: bytes = b"") -> "hashlib.blake2b":
+    """BLAKE2b hasher used for content-addressed media filenames."""
+    return hashlib.blake2b(data, digest_size=16)
+
+
+def save_response(response: requests.Response, filepath: Path, hasher=None) -> None:
+    """
+    Stream a ``stream=True`` response body to filepath in fixed-size chunks.
+
+    Memory stays constant regardless of body size. Raises ValueError (and
+    removes the partial file) if the body exceeds MAX_DOWNLOAD_BYTES. Chunks
+    are also fed to hasher when one is given.
+    """
+    content_length = response.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_DOWNLOAD_BYTES:
+        raise ValueError(f"Response too large: {content_length} bytes")
+
+    written = 0
+    try:
+        with open(filepath, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_DOWNLOAD_BYTES:
+                    raise ValueError(f"Response exceeded {MAX_DOWNLOAD_BYTES} bytes")
+                f.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+    except Exception:
+        Path(filepath).unlink(missing_ok=True)
+        raise
+
+
+def save_response_deduped(response: requests.Response, output_dir: Path, ext: str) -> Path:
+    """
+    Stream a response into output_dir under a name derived from its content.
+
+    Identical media downloaded for different articles ends up in the same
+    file; if that file already exists the new copy is discarded.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=output_dir, suffix=".part")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    hasher = content_digest()
+    save_response(response, tmp_path, hasher)
+
+    filepath = Path(output_dir) / f"{hasher.hexdigest()}.{ext}"
+    if filepath.exists():
+        tmp_path.unlink()
+    else:
+        os.replace(tmp_path, filepath)
+    return filepath
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    Used to remember embed/oEmbed lookups so a video referenced by several
+    articles is only fetched once per worker process.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 86400):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value for key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
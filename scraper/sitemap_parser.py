@@ -213,7 +213,26 @@ class SitemapParser:
         Returns:
             List of article URLs that were published/modified on the target date.
         """
-        all_urls: Set[str] = set()
+        urls_by_date = await self.get_article_urls_by_date(target_date, target_date)
+        return urls_by_date.get(target_date, [])
+
+    async def get_article_urls_by_date(
+        self,
+        start_date: date,
+        end_date: date
+    ) -> Dict[date, List[str]]:
+        """
+        Fetch and parse all sitemaps once, grouping article URLs by date.
+
+        Args:
+            start_date: First date to include.
+            end_date: Last date to include.
+
+        Returns:
+            Dict mapping each date in the range that has articles to the URLs
+            published/modified on it.
+        """
+        urls_by_date: Dict[date, Set[str]] = {}
 
         for sitemap_url in settings.sitemap_urls:
             try:
@@ -221,15 +240,19 @@ class SitemapParser:
                 url_data = self.parse_urls_with_dates(xml_content)
 
                 for url, lastmod in url_data:
+                    # If no lastmod, we'll need to check article's published date after scraping
+                    if lastmod is None:
+                        continue
+
+                    lastmod_date = lastmod.date()
+                    if not start_date <= lastmod_date <= end_date:
+                        continue
+
                     # Skip non-article URLs
                     if not self._is_article_url(url):
                         continue
 
-                    # If we have lastmod date, filter by target date
-                    if lastmod is not None:
-                        if lastmod.date() == target_date:
-                            all_urls.add(url)
-                    # If no lastmod, we'll need to check article's published date after scraping
+                    urls_by_date.setdefault(lastmod_date, set()).add(url)
 
                 self.logger.info(f"Found URLs with date filter from {sitemap_url}")
 
@@ -238,8 +261,9 @@ class SitemapParser:
             except Exception as e:
                 self.logger.error(f"Error processing sitemap {sitemap_url}: {e}")
 
-        self.logger.info(f"Total article URLs for {target_date}: {len(all_urls)}")
-        return list(all_urls)
+        total = sum(len(urls) for urls in urls_by_date.values())
+        self.logger.info(f"Total article URLs for {start_date} to {end_date}: {total}")
+        return {d: list(urls) for d, urls in urls_by_date.items()}
 
     def _is_article_url(self, url: str) -> bool:
         """Check if URL is an article page."""
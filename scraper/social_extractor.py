@@ -1,12 +1,200 @@
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
 from bs4 import BeautifulSoup
 
 from config.logging_config import get_logger
 
-
-@dataclass
+# Subtrees that never contain social embeds; dropped before DOM extraction
+NON_CONTENT_TAGS = ["script", "style", "svg", "noscript"]
+
+# Keyword -> platform for spotting screenshots, checked in priority order
+ALT_SCREENSHOT_KEYWORDS = (
+    ("tiktok", "tiktok"), ("tik tok", "tiktok"),
+    ("instagram", "instagram"), ("ig ", "instagram"), ("insta", "instagram"),
+    ("twitter", "twitter"), ("tweet", "twitter"), (" x ", "twitter"),
+    ("youtube", "youtube"), ("yt ", "youtube"),
+    ("facebook", "facebook"), ("fb ", "facebook"),
+    ("linkedin", "linkedin"),
+)
+SRC_SCREENSHOT_KEYWORDS = (
+    ("tiktok", "tiktok"),
+    ("instagram", "instagram"), ("insta", "instagram"),
+    ("twitter", "twitter"), ("tweet", "twitter"),
+)
+
+
+def _match_keyword(text: str, keywords: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+    """Return the platform of the first keyword found in already-lowercased text."""
+    for keyword, platform in keywords:
+        if keyword in text:
+            return platform
+    return None
+
+
+def _tiktok_username(url: str) -> Optional[str]:
+    """Extract username from TikTok URL."""
+    match = TIKTOK_USERNAME_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _instagram_username(url: str) -> Optional[str]:
+    """Extract username from Instagram URL (limited)."""
+    # Instagram post URLs don't always contain username
+    match = INSTAGRAM_USERNAME_RE.search(url)
+    if match and match.group(1) not in ["p", "reel", "tv", "stories"]:
+        return match.group(1)
+    return None
+
+
+def _twitter_username(url: str) -> Optional[str]:
+    """Extract username from Twitter/X URL."""
+    match = TWITTER_USERNAME_RE.search(url)
+    return match.group(2) if match else None
+
+
+def _youtube_video_id(url: str) -> Optional[str]:
+    """Extract video ID from YouTube URL."""
+    for pattern in YOUTUBE_VIDEO_ID_RES:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _tiktok_blockquote_url(blockquote) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Resolve a TikTok embed blockquote to its video URL and metadata."""
+    cite = blockquote.get("cite", "")
+    data_video_id = blockquote.get("data-video-id", "")
+    url = cite or (f"https://www.tiktok.com/video/{data_video_id}" if data_video_id else None)
+    return url, ({"video_id": data_video_id} if data_video_id else None)
+
+
+def _instagram_blockquote_url(blockquote) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Resolve an Instagram embed blockquote to its permalink."""
+    permalink = blockquote.get("data-instgrm-permalink", "")
+    if permalink:
+        return permalink, None
+    # Find link inside blockquote
+    link = blockquote.find("a", href=INSTAGRAM_POST_LINK_RE)
+    return (link.get("href") if link else None), None
+
+
+def _twitter_blockquote_url(blockquote) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Resolve a Twitter/X embed blockquote to its tweet URL."""
+    link = blockquote.find("a", href=TWITTER_STATUS_LINK_RE)
+    return (link.get("href") if link else None), None
+
+
+def _video_or_post(url: str) -> str:
+    return "video" if "/reel/" in url or "/tv/" in url else "post"
+
+
+def _short_or_video(url: str) -> str:
+    return "short" if "/shorts/" in url else "video"
+
+
+TIKTOK_USERNAME_RE = re.compile(r"tiktok\.com/@([\w.-]+)")
+INSTAGRAM_USERNAME_RE = re.compile(r"instagram\.com/([\w.-]+)/")
+TWITTER_USERNAME_RE = re.compile(r"(twitter|x)\.com/([\w]+)/status/")
+YOUTUBE_VIDEO_ID_RES = (
+    re.compile(r"youtube\.com/embed/([\w-]+)"),
+    re.compile(r"youtube\.com/watch\?v=([\w-]+)"),
+    re.compile(r"youtu\.be/([\w-]+)"),
+    re.compile(r"youtube\.com/shorts/([\w-]+)"),
+)
+INSTAGRAM_POST_LINK_RE = re.compile(r"instagram\.com/p/", re.I)
+TWITTER_STATUS_LINK_RE = re.compile(r"(twitter|x)\.com/.+/status/", re.I)
+
+
+@dataclass(frozen=True)
+class PlatformConfig:
+    """Describes where one platform's content lives in an article."""
+    name: str
+    iframe_src: Pattern[str]
+    anchor_href: Pattern[str]
+    url_scan: Pattern[str]
+    classify_url: Callable[[str], str]  # content_type for links and stray URLs
+    iframe_content_type: str = "embed"
+    blockquote_class: Optional[Pattern[str]] = None
+    blockquote_url: Optional[Callable[[Any], Tuple[Optional[str], Optional[Dict[str, Any]]]]] = None
+    blockquote_content_type: str = "embed"
+    blockquote_first: bool = False
+    blockquote_caption: bool = False
+    username: Optional[Callable[[str], Optional[str]]] = None
+    video_id: Optional[Callable[[str], Optional[str]]] = None  # dedupe key across URL forms
+    canonical_url: Optional[str] = None  # iframe URL template, formatted with video_id
+    thumbnail_url: Optional[str] = None  # formatted with video_id
+    markers: Tuple[str, ...] = ()  # lowercase substrings; platform is skipped when none occur
+
+    def mentioned_in(self, haystack: Union[str, bytes]) -> bool:
+        """Cheap pre-screen: does the lowercased HTML mention this platform at all?"""
+        if isinstance(haystack, bytes):
+            return any(marker.encode() in haystack for marker in self.markers)
+        return any(marker in haystack for marker in self.markers)
+
+
+TIKTOK_CONFIG = PlatformConfig(
+    name="tiktok",
+    markers=("tiktok",),
+    iframe_src=re.compile(r"tiktok\.com", re.I),
+    blockquote_class=re.compile(r"tiktok-embed", re.I),
+    blockquote_url=_tiktok_blockquote_url,
+    anchor_href=re.compile(r"tiktok\.com/@[\w.-]+/video/", re.I),
+    url_scan=re.compile(
+        r"https?://(?:www\.)?tiktok\.com/(?:@[\w\.-]+/video/\d+|embed/[\w/-]+|t/[\w\d]+)", re.I
+    ),
+    classify_url=lambda url: "video",
+    username=_tiktok_username,
+)
+
+INSTAGRAM_CONFIG = PlatformConfig(
+    name="instagram",
+    markers=("instagram",),
+    iframe_src=re.compile(r"instagram\.com", re.I),
+    blockquote_class=re.compile(r"instagram-media", re.I),
+    blockquote_url=_instagram_blockquote_url,
+    blockquote_first=True,
+    anchor_href=re.compile(r"instagram\.com/(?:p|reel|tv)/[\w-]+", re.I),
+    url_scan=re.compile(r"https?://(?:www\.)?instagram\.com/(?:reel|p|tv)/[\w-]+", re.I),
+    classify_url=_video_or_post,
+    username=_instagram_username,
+)
+
+TWITTER_CONFIG = PlatformConfig(
+    name="twitter",
+    markers=("twitter", "x.com"),
+    iframe_src=re.compile(r"platform\.(twitter|x)\.com", re.I),
+    blockquote_class=re.compile(r"twitter-tweet", re.I),
+    blockquote_url=_twitter_blockquote_url,
+    blockquote_content_type="tweet",
+    blockquote_first=True,
+    blockquote_caption=True,
+    anchor_href=re.compile(r"(twitter|x)\.com/.+/status/\d+", re.I),
+    url_scan=re.compile(r"https?://(?:www\.)?(?:twitter\.com|x\.com)/[\w]+/status/\d+", re.I),
+    classify_url=lambda url: "tweet",
+    username=_twitter_username,
+)
+
+YOUTUBE_CONFIG = PlatformConfig(
+    name="youtube",
+    markers=("youtu",),
+    iframe_src=re.compile(r"youtube\.com/embed/", re.I),
+    iframe_content_type="video",
+    anchor_href=re.compile(r"youtube\.com/watch\?v=[\w-]+|youtu\.be/[\w-]+|youtube\.com/shorts/[\w-]+", re.I),
+    url_scan=re.compile(
+        r"https?://(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/shorts/)[\w-]+", re.I
+    ),
+    classify_url=_short_or_video,
+    video_id=_youtube_video_id,
+    canonical_url="https://www.youtube.com/watch?v={video_id}",
+    # hqdefault exists for every video, unlike maxresdefault which 404s
+    # for many shorts and older uploads.
+    thumbnail_url="https://img.youtube.com/vi/{video_id}/hqdefault.jpg",
+)
+
+
+@dataclass(slots=True)
 class SocialContentData:
     """Data class for social media content."""
     platform: str  # tiktok/instagram/twitter/youtube
@@ -26,59 +214,59 @@ class SocialExtractor:
     def __init__(self):
         self.logger = get_logger()
 
-    def _regex_urls(self, html: str, pattern: str) -> List[str]:
-        """Find unique URLs in raw HTML/text using regex."""
+    def _regex_urls(self, html: str, pattern: Pattern[str]) -> List[str]:
+        """Find unique URLs in raw HTML/text using a compiled regex."""
         urls = []
         seen = set()
-        for match in re.finditer(pattern, html, re.IGNORECASE):
+        for match in pattern.finditer(html):
             url = match.group(0)
             if url not in seen:
                 seen.add(url)
                 urls.append(url)
         return urls
 
-    def extract_all(self, html_content: str) -> List[SocialContentData]:
-        """Extract all social media content from HTML."""
+    def extract_all(self, html_content: Union[str, bytes]) -> List[SocialContentData]:
+        """
+        Extract all social media content from HTML.
+
+        Raw response bytes can be passed as-is; the parser decodes them once
+        instead of the caller decoding to str first.
+        """
         # Use lxml when available; fall back gracefully so scraping doesn't stop.
         try:
             soup = BeautifulSoup(html_content, "lxml")
         except Exception:
             soup = BeautifulSoup(html_content, "html.parser")
 
-        contents: List[SocialContentData] = []
-        position = 0
-        raw_html = html_content  # keep original string for regex-based URL discovery
-
-        # Extract TikTok
-        tiktok_contents = self._extract_tiktok(soup, raw_html)
-        for content in tiktok_contents:
-            content.position_in_article = position
-            contents.append(content)
-            position += 1
+        # Screenshot <img>s can sit inside <noscript>, so find them before
+        # non-content subtrees are stripped
+        screenshot_contents = self._extract_screenshots(soup)
 
-        # Extract Instagram
-        instagram_contents = self._extract_instagram(soup, raw_html)
-        for content in instagram_contents:
-            content.position_in_article = position
-            contents.append(content)
-            position += 1
+        # Keep script bodies (__NEXT_DATA__ etc.) for regex URL discovery, then
+        # drop non-content subtrees so the DOM passes and regex scans see less.
+        raw_html = self._build_scan_text(soup)
 
-        # Extract Twitter/X
-        twitter_contents = self._extract_twitter(soup, raw_html)
-        for content in twitter_contents:
-            content.position_in_article = position
-            contents.append(content)
-            position += 1
+        contents: List[SocialContentData] = []
+        position = 0
 
-        # Extract YouTube
-        youtube_contents = self._extract_youtube(soup, raw_html)
-        for content in youtube_contents:
-            content.position_in_article = position
-            contents.append(content)
-            position += 1
+        # Most articles embed few or no platforms; skip the DOM and regex
+        # passes for any platform the page never mentions.
+        haystack = html_content.lower()
+        extractors = [
+            (TIKTOK_CONFIG, self._extract_tiktok),
+            (INSTAGRAM_CONFIG, self._extract_instagram),
+            (TWITTER_CONFIG, self._extract_twitter),
+            (YOUTUBE_CONFIG, self._extract_youtube),
+        ]
+        for config, extract in extractors:
+            if not config.mentioned_in(haystack):
+                continue
+            for content in extract(soup, raw_html):
+                content.position_in_article = position
+                contents.append(content)
+                position += 1
 
-        # Extract social media screenshots
-        screenshot_contents = self._extract_screenshots(soup)
+        # Screenshots follow the embeds
         for content in screenshot_contents:
             content.position_in_article = position
             contents.append(content)
@@ -87,331 +275,125 @@ class SocialExtractor:
         self.logger.debug(f"Extracted {len(contents)} social media contents")
         return contents
 
-    def _extract_tiktok(self, soup: BeautifulSoup, raw_html: str) -> List[SocialContentData]:
-        """Extract TikTok embeds and links."""
-        contents: List[SocialContentData] = []
-        seen_urls = set()
-
-        # TikTok iframes
-        tiktok_iframes = soup.find_all("iframe", src=re.compile(r"tiktok\.com", re.I))
-        for iframe in tiktok_iframes:
-            src = iframe.get("src", "")
-            if src in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="tiktok",
-                content_type="embed",
-                url=src,
-                embed_html=str(iframe),
-                username=self._extract_tiktok_username(src),
-            ))
-            seen_urls.add(src)
-
-        # TikTok blockquotes
-        tiktok_blockquotes = soup.find_all("blockquote", class_=re.compile(r"tiktok-embed", re.I))
-        for blockquote in tiktok_blockquotes:
-            cite = blockquote.get("cite", "")
-            data_video_id = blockquote.get("data-video-id", "")
-            url = cite or (f"https://www.tiktok.com/video/{data_video_id}" if data_video_id else None)
-            if url and url in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="tiktok",
-                content_type="embed",
-                url=url,
-                embed_html=str(blockquote),
-                username=self._extract_tiktok_username(url or ""),
-                metadata={"video_id": data_video_id} if data_video_id else None,
-            ))
-            if url:
-                seen_urls.add(url)
+    def _build_scan_text(self, soup: BeautifulSoup) -> str:
+        """
+        Build the text scanned by the regex URL passes and strip non-content tags.
 
-        # TikTok links in content
-        tiktok_links = soup.find_all("a", href=re.compile(r"tiktok\.com/@[\w.-]+/video/", re.I))
-        for link in tiktok_links:
-            href = link.get("href", "")
-            # Avoid duplicates from iframes/blockquotes
-            if href and href not in seen_urls:
-                contents.append(SocialContentData(
-                    platform="tiktok",
-                    content_type="video",
-                    url=href,
-                    username=self._extract_tiktok_username(href),
-                    caption=link.get_text(strip=True) or None,
-                ))
-                seen_urls.add(href)
+        Script bodies are kept for their URLs, then the remaining markup is
+        serialized so URLs in any attribute (e.g. data-url) are still scanned.
+        """
+        parts = [script.string for script in soup.find_all("script") if script.string]
 
-        # Regex scan across raw HTML/JSON to catch URLs embedded in scripts (__NEXT_DATA__)
-        regex_urls = self._regex_urls(
-            raw_html,
-            r"https?://(?:www\.)?tiktok\.com/(?:@[\w\.-]+/video/\d+|embed/[\w/-]+|t/[\w\d]+)"
-        )
-        for url in regex_urls:
-            if url in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="tiktok",
-                content_type="video",
-                url=url,
-                username=self._extract_tiktok_username(url),
-            ))
-            seen_urls.add(url)
+        for tag in soup(NON_CONTENT_TAGS):
+            tag.decompose()
 
-        return contents
+        parts.append(str(soup))
+        return "\n".join(parts)
 
-    def _extract_tiktok_username(self, url: str) -> Optional[str]:
-        """Extract username from TikTok URL."""
-        match = re.search(r"tiktok\.com/@([\w.-]+)", url)
-        return match.group(1) if match else None
+    def _extract_tiktok(self, soup: BeautifulSoup, raw_html: str) -> List[SocialContentData]:
+        """Extract TikTok embeds and links."""
+        return self._extract_platform(TIKTOK_CONFIG, soup, raw_html)
 
     def _extract_instagram(self, soup: BeautifulSoup, raw_html: str) -> List[SocialContentData]:
         """Extract Instagram embeds and links."""
-        contents: List[SocialContentData] = []
-        seen_urls = set()
-
-        # Instagram blockquotes
-        ig_blockquotes = soup.find_all("blockquote", class_=re.compile(r"instagram-media", re.I))
-        for blockquote in ig_blockquotes:
-            data_instgrm_permalink = blockquote.get("data-instgrm-permalink", "")
-            # Find link inside blockquote
-            link = blockquote.find("a", href=re.compile(r"instagram\.com/p/", re.I))
-            url = data_instgrm_permalink or (link.get("href") if link else None)
-            if url in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="instagram",
-                content_type="embed",
-                url=url,
-                embed_html=str(blockquote),
-                username=self._extract_instagram_username(url or ""),
-            ))
-            if url:
-                seen_urls.add(url)
-
-        # Instagram iframes
-        ig_iframes = soup.find_all("iframe", src=re.compile(r"instagram\.com", re.I))
-        for iframe in ig_iframes:
-            src = iframe.get("src", "")
-            if src in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="instagram",
-                content_type="embed",
-                url=src,
-                embed_html=str(iframe),
-                username=self._extract_instagram_username(src),
-            ))
-            seen_urls.add(src)
-
-        # Instagram links in content
-        ig_patterns = [
-            r"instagram\.com/p/[\w-]+",
-            r"instagram\.com/reel/[\w-]+",
-            r"instagram\.com/tv/[\w-]+",
-        ]
-        for pattern in ig_patterns:
-            ig_links = soup.find_all("a", href=re.compile(pattern, re.I))
-            for link in ig_links:
-                href = link.get("href", "")
-                if href and href not in seen_urls:
-                    content_type = "video" if "/reel/" in href or "/tv/" in href else "post"
-                    contents.append(SocialContentData(
-                        platform="instagram",
-                        content_type=content_type,
-                        url=href,
-                        username=self._extract_instagram_username(href),
-                        caption=link.get_text(strip=True) or None,
-                    ))
-                    seen_urls.add(href)
-
-        # Regex scan across raw HTML/JSON for stray instagram links (e.g., inside scripts)
-        regex_urls = self._regex_urls(
-            raw_html,
-            r"https?://(?:www\.)?instagram\.com/(?:reel|p|tv)/[\w-]+"
-        )
-        for url in regex_urls:
-            if url in seen_urls:
-                continue
-            content_type = "video" if any(seg in url for seg in ["/reel/", "/tv/"]) else "post"
-            contents.append(SocialContentData(
-                platform="instagram",
-                content_type=content_type,
-                url=url,
-                username=self._extract_instagram_username(url),
-            ))
-            seen_urls.add(url)
-
-        return contents
-
-    def _extract_instagram_username(self, url: str) -> Optional[str]:
-        """Extract username from Instagram URL (limited)."""
-        # Instagram post URLs don't always contain username
-        match = re.search(r"instagram\.com/([\w.-]+)/", url)
-        if match and match.group(1) not in ["p", "reel", "tv", "stories"]:
-            return match.group(1)
-        return None
+        return self._extract_platform(INSTAGRAM_CONFIG, soup, raw_html)
 
     def _extract_twitter(self, soup: BeautifulSoup, raw_html: str) -> List[SocialContentData]:
         """Extract Twitter/X embeds and links."""
-        contents: List[SocialContentData] = []
-        seen_urls = set()
-
-        # Twitter blockquotes
-        twitter_blockquotes = soup.find_all("blockquote", class_=re.compile(r"twitter-tweet", re.I))
-        for blockquote in twitter_blockquotes:
-            # Find the tweet link
-            link = blockquote.find("a", href=re.compile(r"(twitter|x)\.com/.+/status/", re.I))
-            url = link.get("href") if link else None
-            if url in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="twitter",
-                content_type="tweet",
-                url=url,
-                embed_html=str(blockquote),
-                username=self._extract_twitter_username(url or ""),
-                caption=blockquote.get_text(strip=True)[:500] if blockquote.get_text(strip=True) else None,
-            ))
-            if url:
-                seen_urls.add(url)
-
-        # Twitter iframes
-        twitter_iframes = soup.find_all("iframe", src=re.compile(r"platform\.(twitter|x)\.com", re.I))
-        for iframe in twitter_iframes:
-            src = iframe.get("src", "")
-            if src in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="twitter",
-                content_type="embed",
-                url=src,
-                embed_html=str(iframe),
-            ))
-            seen_urls.add(src)
-
-        # Twitter/X links in content
-        twitter_links = soup.find_all("a", href=re.compile(r"(twitter|x)\.com/.+/status/\d+", re.I))
-        for link in twitter_links:
-            href = link.get("href", "")
-            if href and href not in seen_urls:
-                contents.append(SocialContentData(
-                    platform="twitter",
-                    content_type="tweet",
-                    url=href,
-                    username=self._extract_twitter_username(href),
-                    caption=link.get_text(strip=True) or None,
-                ))
-                seen_urls.add(href)
-
-        # Regex scan raw HTML/JSON
-        regex_urls = self._regex_urls(
-            raw_html,
-            r"https?://(?:www\.)?(?:twitter\.com|x\.com)/[\w]+/status/\d+"
-        )
-        for url in regex_urls:
-            if url in seen_urls:
-                continue
-            contents.append(SocialContentData(
-                platform="twitter",
-                content_type="tweet",
-                url=url,
-                username=self._extract_twitter_username(url),
-            ))
-            seen_urls.add(url)
-
-        return contents
-
-    def _extract_twitter_username(self, url: str) -> Optional[str]:
-        """Extract username from Twitter/X URL."""
-        match = re.search(r"(twitter|x)\.com/([\w]+)/status/", url)
-        return match.group(2) if match else None
+        return self._extract_platform(TWITTER_CONFIG, soup, raw_html)
 
     def _extract_youtube(self, soup: BeautifulSoup, raw_html: str) -> List[SocialContentData]:
         """Extract YouTube embeds and links."""
+        return self._extract_platform(YOUTUBE_CONFIG, soup, raw_html)
+
+    def _extract_platform(
+        self,
+        config: PlatformConfig,
+        soup: BeautifulSoup,
+        raw_html: str
+    ) -> List[SocialContentData]:
+        """Extract one platform's iframes, blockquotes, links and stray URLs."""
         contents: List[SocialContentData] = []
-        seen_video_ids = set()
         seen_urls = set()
+        seen_video_ids = set()
 
-        # YouTube iframes
-        yt_iframes = soup.find_all("iframe", src=re.compile(r"youtube\.com/embed/", re.I))
-        for iframe in yt_iframes:
-            src = iframe.get("src", "")
-            video_id = self._extract_youtube_video_id(src)
-            if src in seen_urls or (video_id and video_id in seen_video_ids):
-                continue
-            contents.append(SocialContentData(
-                platform="youtube",
-                content_type="video",
-                url=f"https://www.youtube.com/watch?v={video_id}" if video_id else src,
-                embed_html=str(iframe),
-                thumbnail_url=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg" if video_id else None,
-                metadata={"video_id": video_id} if video_id else None,
-            ))
-            seen_urls.add(src)
+        def is_seen(url: Optional[str], video_id: Optional[str]) -> bool:
+            return url in seen_urls or (video_id is not None and video_id in seen_video_ids)
+
+        def add(
+            seen_url: Optional[str],
+            url: Optional[str],
+            content_type: str,
+            video_id: Optional[str],
+            embed_html: Optional[str] = None,
+            caption: Optional[str] = None,
+            metadata: Optional[Dict[str, Any]] = None,
+        ) -> None:
             if video_id:
-                seen_video_ids.add(video_id)
-
-        # YouTube links
-        yt_patterns = [
-            r"youtube\.com/watch\?v=[\w-]+",
-            r"youtu\.be/[\w-]+",
-            r"youtube\.com/shorts/[\w-]+",
-        ]
-        for pattern in yt_patterns:
-            yt_links = soup.find_all("a", href=re.compile(pattern, re.I))
-            for link in yt_links:
-                href = link.get("href", "")
-                video_id = self._extract_youtube_video_id(href)
-                if href and href not in seen_urls and (video_id not in seen_video_ids):
-                    content_type = "short" if "/shorts/" in href else "video"
-                    contents.append(SocialContentData(
-                        platform="youtube",
-                        content_type=content_type,
-                        url=href,
-                        thumbnail_url=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg" if video_id else None,
-                        caption=link.get_text(strip=True) or None,
-                        metadata={"video_id": video_id} if video_id else None,
-                    ))
-                    seen_urls.add(href)
-                    if video_id:
-                        seen_video_ids.add(video_id)
-
-        # Regex scan raw HTML/JSON
-        regex_urls = self._regex_urls(
-            raw_html,
-            r"https?://(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/shorts/)[\w-]+"
-        )
-        for url in regex_urls:
-            video_id = self._extract_youtube_video_id(url)
-            if url in seen_urls or (video_id and video_id in seen_video_ids):
-                continue
-            content_type = "short" if "/shorts/" in url else "video"
+                metadata = {"video_id": video_id}
             contents.append(SocialContentData(
-                platform="youtube",
+                platform=config.name,
                 content_type=content_type,
                 url=url,
-                thumbnail_url=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg" if video_id else None,
-                metadata={"video_id": video_id} if video_id else None,
+                embed_html=embed_html,
+                thumbnail_url=config.thumbnail_url.format(video_id=video_id) if config.thumbnail_url and video_id else None,
+                username=config.username(url or "") if config.username else None,
+                caption=caption,
+                metadata=metadata,
             ))
-            seen_urls.add(url)
+            if seen_url:
+                seen_urls.add(seen_url)
             if video_id:
                 seen_video_ids.add(video_id)
 
-        return contents
+        def scan_iframes() -> None:
+            for iframe in soup.find_all("iframe", src=config.iframe_src):
+                src = iframe.get("src", "")
+                video_id = config.video_id(src) if config.video_id else None
+                if is_seen(src, video_id):
+                    continue
+                url = config.canonical_url.format(video_id=video_id) if config.canonical_url and video_id else src
+                add(src, url, config.iframe_content_type, video_id, embed_html=str(iframe))
+
+        def scan_blockquotes() -> None:
+            for blockquote in soup.find_all("blockquote", class_=config.blockquote_class):
+                url, metadata = config.blockquote_url(blockquote)
+                if url and url in seen_urls:
+                    continue
+                caption = None
+                if config.blockquote_caption:
+                    caption = blockquote.get_text(strip=True)[:500] or None
+                add(
+                    url, url, config.blockquote_content_type, None,
+                    embed_html=str(blockquote), caption=caption, metadata=metadata,
+                )
+
+        if config.blockquote_class and config.blockquote_first:
+            scan_blockquotes()
+            scan_iframes()
+        else:
+            scan_iframes()
+            if config.blockquote_class:
+                scan_blockquotes()
+
+        # Links in content
+        for link in soup.find_all("a", href=config.anchor_href):
+            href = link.get("href", "")
+            video_id = config.video_id(href) if config.video_id else None
+            if href and not is_seen(href, video_id):
+                add(
+                    href, href, config.classify_url(href), video_id,
+                    caption=link.get_text(strip=True) or None,
+                )
 
-    def _extract_youtube_video_id(self, url: str) -> Optional[str]:
-        """Extract video ID from YouTube URL."""
-        patterns = [
-            r"youtube\.com/embed/([\w-]+)",
-            r"youtube\.com/watch\?v=([\w-]+)",
-            r"youtu\.be/([\w-]+)",
-            r"youtube\.com/shorts/([\w-]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        # Regex scan across raw HTML/JSON to catch URLs embedded in scripts (__NEXT_DATA__)
+        for url in self._regex_urls(raw_html, config.url_scan):
+            video_id = config.video_id(url) if config.video_id else None
+            if is_seen(url, video_id):
+                continue
+            add(url, url, config.classify_url(url), video_id)
+
+        return contents
 
     def _extract_screenshots(self, soup: BeautifulSoup) -> List[SocialContentData]:
         """Extract social media screenshots from images."""
@@ -424,29 +406,9 @@ class SocialExtractor:
             src = img.get("src") or img.get("data-src") or ""
 
             # Check if alt text or filename suggests social media screenshot
-            platform = None
-            if any(kw in alt for kw in ["tiktok", "tik tok"]):
-                platform = "tiktok"
-            elif any(kw in alt for kw in ["instagram", "ig ", "insta"]):
-                platform = "instagram"
-            elif any(kw in alt for kw in ["twitter", "tweet", " x "]):
-                platform = "twitter"
-            elif any(kw in alt for kw in ["youtube", "yt "]):
-                platform = "youtube"
-            elif any(kw in alt for kw in ["facebook", "fb "]):
-                platform = "facebook"
-            elif any(kw in alt for kw in ["linkedin"]):
-                platform = "linkedin"
-
-            # Also check src/filename
+            platform = _match_keyword(alt, ALT_SCREENSHOT_KEYWORDS)
             if not platform:
-                src_lower = src.lower()
-                if "tiktok" in src_lower:
-                    platform = "tiktok"
-                elif "instagram" in src_lower or "insta" in src_lower:
-                    platform = "instagram"
-                elif "twitter" in src_lower or "tweet" in src_lower:
-                    platform = "twitter"
+                platform = _match_keyword(src.lower(), SRC_SCREENSHOT_KEYWORDS)
 
             if platform:
                 contents.append(SocialContentData(
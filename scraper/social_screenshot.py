@@ -1,40 +1,95 @@
 """Social media screenshot/thumbnail capture for all platforms."""
 import re
+import threading
 import time
-import random
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
 import requests
 
+from config.logging_config import get_logger
+from .http_session import TTLCache, get_http_session, response_json, save_response_deduped
+
+logger = get_logger()
+
+_INSTAGRAM_SHORTCODE_RE = re.compile(r'/(?:p|reel)/([A-Za-z0-9_-]+)')
+_YOUTUBE_ID_RES = (
+    re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([A-Za-z0-9_-]{11})'),
+    re.compile(r'youtube\.com/shorts/([A-Za-z0-9_-]{11})'),
+)
+
+# Minimum seconds between requests to the same host. Requests to different
+# hosts are not throttled against each other.
+HOST_MIN_INTERVALS = {
+    "www.tiktok.com": 0.5,
+    "publish.twitter.com": 0.5,
+    "www.instagram.com": 1.0,
+    "img.youtube.com": 0.25,
+}
+DEFAULT_MIN_INTERVAL = 0.5
+
+_host_last_request: Dict[str, float] = {}
+_host_lock = threading.Lock()
+
+# oEmbed responses by endpoint URL, stored as fetched; callers get a copy.
+# TikTok captures fall back to these same lookups
+_oembed_cache = TTLCache(maxsize=4096, ttl=86400)
+
+
+def _throttle_host(url: str) -> None:
+    """Sleep only as long as needed to respect the per-host request interval."""
+    host = urlsplit(url).hostname or ""
+    min_interval = HOST_MIN_INTERVALS.get(host, DEFAULT_MIN_INTERVAL)
+
+    with _host_lock:
+        now = time.monotonic()
+        last = _host_last_request.get(host)
+        wait = max(0.0, min_interval - (now - last)) if last is not None else 0.0
+        # Reserve the slot before releasing the lock so concurrent callers queue up
+        _host_last_request[host] = now + wait
+
+    if wait:
+        time.sleep(wait)
+
+
+def _get_oembed_json(oembed_url: str) -> dict:
+    """
+    GET an oEmbed endpoint and return a copy of its JSON, cached per URL.
+
+    Raises on non-200 responses so failures are not cached and get retried.
+    """
+    data = _oembed_cache.get(oembed_url)
+    if data is None:
+        _throttle_host(oembed_url)
+        response = get_http_session().get(oembed_url, timeout=10)
+        response.raise_for_status()
+        data = response_json(response)
+        _oembed_cache.set(oembed_url, data)
+    return dict(data)
+
 
 def fetch_tiktok_oembed(url: str) -> Optional[dict]:
     """Fetch TikTok oEmbed data."""
     try:
-        oembed_url = f"https://www.tiktok.com/oembed?url={url}"
-        response = requests.get(oembed_url, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-    except Exception as e:
-        print(f"[SOCIAL] TikTok oEmbed error: {e}")
+        return _get_oembed_json(f"https://www.tiktok.com/oembed?url={url}")
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"TikTok oEmbed error: {e}")
     return None
 
 
 def fetch_instagram_oembed(url: str) -> Optional[dict]:
     """Fetch Instagram oEmbed data (requires access token for full data)."""
     # Instagram oEmbed requires access token, try basic approach
-    try:
-        # Try to get from URL pattern
-        # Instagram thumbnail pattern: https://www.instagram.com/p/{shortcode}/media/?size=m
-        # Also supports reels: https://www.instagram.com/reel/{shortcode}/
-        match = re.search(r'/(?:p|reel)/([A-Za-z0-9_-]+)', url)
-        if match:
-            shortcode = match.group(1)
-            # Try media endpoint (may not always work)
-            media_url = f"https://www.instagram.com/p/{shortcode}/media/?size=m"
-            return {"thumbnail_url": media_url, "shortcode": shortcode}
-    except Exception as e:
-        print(f"[SOCIAL] Instagram parse error: {e}")
+    # Instagram thumbnail pattern: https://www.instagram.com/p/{shortcode}/media/?size=m
+    # Also supports reels: https://www.instagram.com/reel/{shortcode}/
+    match = _INSTAGRAM_SHORTCODE_RE.search(url)
+    if match:
+        shortcode = match.group(1)
+        # Try media endpoint (may not always work)
+        media_url = f"https://www.instagram.com/p/{shortcode}/media/?size=m"
+        return {"thumbnail_url": media_url, "shortcode": shortcode}
     return None
 
 
@@ -42,32 +97,23 @@ def fetch_twitter_oembed(url: str) -> Optional[dict]:
     """Fetch Twitter/X oEmbed data."""
     try:
         # Twitter oEmbed endpoint
-        oembed_url = f"https://publish.twitter.com/oembed?url={url}"
-        response = requests.get(oembed_url, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-    except Exception as e:
-        print(f"[SOCIAL] Twitter oEmbed error: {e}")
+        return _get_oembed_json(f"https://publish.twitter.com/oembed?url={url}")
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"Twitter oEmbed error: {e}")
     return None
 
 
+@lru_cache(maxsize=4096)
 def fetch_youtube_thumbnail(url: str) -> Optional[str]:
     """Get YouTube video thumbnail URL."""
-    try:
-        # Extract video ID from various YouTube URL formats
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([A-Za-z0-9_-]{11})',
-            r'youtube\.com/shorts/([A-Za-z0-9_-]{11})',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                video_id = match.group(1)
-                # YouTube thumbnail URLs
-                # maxresdefault is highest quality, fallback to hqdefault
-                return f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
-    except Exception as e:
-        print(f"[SOCIAL] YouTube parse error: {e}")
+    # Extract video ID from various YouTube URL formats
+    for pattern in _YOUTUBE_ID_RES:
+        match = pattern.search(url)
+        if match:
+            video_id = match.group(1)
+            # YouTube thumbnail URLs
+            # maxresdefault is highest quality, fallback to hqdefault
+            return f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
     return None
 
 
@@ -80,16 +126,13 @@ def download_thumbnail(
 ) -> Optional[str]:
     """Download thumbnail image from URL."""
     try:
-        response = requests.get(thumbnail_url, timeout=15, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
-        if response.status_code == 200:
+        _throttle_host(thumbnail_url)
+        with get_http_session().get(thumbnail_url, timeout=15, stream=True) as response:
+            if response.status_code != 200:
+                return None
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_slug = re.sub(r'[^\w\-]', '_', article_slug)[:50]
-            
             # Determine file extension
             content_type = response.headers.get('content-type', '')
             ext = 'jpg'
@@ -98,16 +141,13 @@ def download_thumbnail(
             elif 'webp' in content_type:
                 ext = 'webp'
             
-            filename = f"{safe_slug}_{platform}_{index}_{timestamp}.{ext}"
-            filepath = output_path / filename
+            # Named by content hash so a thumbnail shared by articles is stored once
+            filepath = save_response_deduped(response, output_path, ext)
             
-            with open(filepath, "wb") as f:
-                f.write(response.content)
-            
-            print(f"[SOCIAL] Downloaded {platform} thumbnail: {filename}")
+            logger.info(f"Downloaded {platform} thumbnail: {filepath.name}")
             return str(filepath)
-    except Exception as e:
-        print(f"[SOCIAL] Download error for {platform}: {e}")
+    except (requests.RequestException, OSError, ValueError) as e:
+        logger.warning(f"Download error for {platform}: {e}")
     return None
 
 
@@ -206,9 +246,5 @@ def capture_screenshots_for_article(
         
         sc["screenshot_path"] = path
         sc["screenshot_source"] = source
-        
-        # Small delay between downloads
-        if path:
-            time.sleep(random.uniform(0.5, 1.5))
     
     return social_contents
@@ -1,141 +1,396 @@
 """
-Synchronous scraper that runs in a separate process.
+Synchronous scraper that runs on worker threads (worker processes on Windows).
 This avoids Windows asyncio subprocess issues with Playwright.
 """
-import json
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
+import atexit
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, Optional, List, Dict, Any, Tuple, TYPE_CHECKING
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+
+import requests
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from config.logging_config import get_logger
+from utils.helpers import json_loads
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # selectolax is optional; fall back to BeautifulSoup
+    HTMLParser = None
+
+from .http_session import TTLCache, get_http_session, response_json
 
 if TYPE_CHECKING:
     from bs4 import BeautifulSoup
 
-# Process pool executor for scraping
-_scraper_executor = None
+logger = get_logger()
+
+# Executor for batch scraping, and its worker count
+_batch_executor = None
+_batch_workers = 1
+
+# Social content patterns, compiled once per process. Named groups classify
+# the platform of a match via match.lastgroup.
+_SOCIAL_TAGS = frozenset({"iframe", "a", "blockquote"})
+_RE_IFRAME_SRC = re.compile(
+    r"(?P<sge>/embed/video/)|(?P<tiktok>tiktok\.com)|(?P<youtube>youtube\.com|youtu\.be)",
+    re.I
+)
+_RE_LINK_HREF = re.compile(
+    r"(?P<tiktok>tiktok\.com)"
+    r"|(?P<instagram>instagram\.com/(?:p|reel|tv)/)"
+    r"|(?P<twitter>(?:twitter|x)\.com/\w+/status/)"
+    r"|(?P<youtube>youtube\.com/watch|youtu\.be/)",
+    re.I
+)
+_RE_BLOCKQUOTE_CLASS = re.compile(r"(?P<instagram>instagram)|(?P<twitter>twitter)", re.I)
+_RE_SGE_EMBED_ID = re.compile(r"/embed/video/([a-f0-9-]+)", re.I)
+_RE_IG_HOST = re.compile(r"instagram\.com", re.I)
+_RE_TWITTER_HOST = re.compile(r"(twitter|x)\.com", re.I)
+# Cheap test on the raw HTML: no match means no social content to parse for
+_RE_SOCIAL_ANY = re.compile(
+    r"/embed/video/|tiktok\.com|instagram|twitter|x\.com/|youtube\.com|youtu\.be",
+    re.I
+)
+# Query parameters that identify content; all others are tracking noise
+_SOCIAL_QUERY_KEYS = frozenset({"v", "t"})
+
+# SGE embed API responses by embed ID; videos recur across articles
+_embed_details_cache = TTLCache(maxsize=4096, ttl=86400)
+
+# Playwright driver and browser shared by every scrape in a worker thread;
+# the sync API is bound to the thread that started it, so each thread has its own
+_local = threading.local()
+
+# Per-thread browser closers run by close_executor_browsers; modules keeping
+# their own thread-local browser add theirs with register_thread_browser
+_thread_browser_closers: List[Callable[[], None]] = []
+
+# Seconds a worker waits for the others while closing browsers, in case some
+# are still busy with another run's articles
+_CLOSE_BARRIER_TIMEOUT = 60
+
+# Article scraping only needs the HTML and __NEXT_DATA__
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Ad/analytics hosts that only slow page loads down
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "intercom.io",
+    "clarity.ms",
+    "analytics.tiktok.com",
+)
+
+
+# Raw text of the __NEXT_DATA__ script (textContent skips layout, unlike innerText)
+_NEXT_DATA_TEXT_JS = (
+    "() => { const el = document.getElementById('__NEXT_DATA__'); "
+    "return el ? el.textContent : null; }"
+)
+
+# Post fields holding the publish date, in lookup order
+_POST_DATE_FIELDS = ("date", "publishedAt", "createdAt", "published_at", "created_at")
+
+# Date formats tried after ISO-8601 and before falling back to dateutil
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%b %d, %Y",
+    "%B %d, %Y",
+)
+
+# Post fields holding the article body; stored separately as content
+_POST_CONTENT_KEYS = frozenset({"content", "contentRendered", "contentHtml", "body", "html"})
+
+# Single readiness check for article pages, evaluated in the browser
+_PAGE_READY_JS = (
+    "() => document.getElementById('__NEXT_DATA__') && "
+    "document.querySelector('article, .article-content, .post-content, main')"
+)
+
+
+def _is_tracker(url: str) -> bool:
+    """Check if a request goes to a known ad/analytics host."""
+    return any(host in url for host in BLOCKED_HOSTS)
+
+
+def _block_non_essential(route) -> None:
+    """Route handler aborting heavy resources and trackers."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_tracker(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def create_scrape_executor(max_workers: int, thread_name_prefix: str) -> Executor:
+    """
+    Create the executor scrape_article_sync runs on.
+
+    Threads elsewhere; on Windows a process pool, because sync_playwright()
+    builds a worker thread's loop from the current event loop policy, and
+    under uvicorn --reload that is the Selector policy, which cannot spawn
+    the Playwright driver. A fresh process gets the default Proactor loop.
+    """
+    max_workers = max(1, max_workers)
+    if sys.platform == "win32":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+
+def register_thread_browser(closer: Callable[[], None]) -> None:
+    """Have close_executor_browsers call closer on each worker thread."""
+    _thread_browser_closers.append(closer)
 
 
-def _get_scraper_executor():
-    """Get or create process pool executor for scraping."""
-    global _scraper_executor
-    if _scraper_executor is None:
-        _scraper_executor = ProcessPoolExecutor(max_workers=1)
-    return _scraper_executor
+def close_executor_browsers(executor: Executor, max_workers: int) -> None:
+    """
+    Close the browsers launched on the worker threads of executor.
+
+    Sync Playwright objects can only be closed on their own thread, so one
+    closing task is queued per worker, and a barrier keeps each on a
+    different thread. Threads relaunch their browser when next used.
+    Process pools are skipped; their browsers go with the worker processes.
+    """
+    if not isinstance(executor, ThreadPoolExecutor):
+        return
+    max_workers = max(1, max_workers)
+    barrier = threading.Barrier(max_workers)
+
+    def close() -> None:
+        for closer in _thread_browser_closers:
+            closer()
+        try:
+            barrier.wait(timeout=_CLOSE_BARRIER_TIMEOUT)
+        except threading.BrokenBarrierError:
+            pass
+
+    wait([executor.submit(close) for _ in range(max_workers)])
+
+
+def _get_batch_executor(max_workers: Optional[int] = None):
+    """Get or create the executor used for batch scraping."""
+    global _batch_executor, _batch_workers
+    if _batch_executor is None:
+        if max_workers is None:
+            from config.settings import settings
+            max_workers = settings.scrape_workers
+        _batch_workers = max(1, max_workers)
+        _batch_executor = create_scrape_executor(_batch_workers, "scrape-batch")
+    return _batch_executor
+
+
+def _get_browser():
+    """
+    Get or launch the headless Chromium reused by this worker thread.
+
+    Each article gets its own context, so only the browser start-up cost is
+    shared. Playwright's sync API is bound to the thread that started it, so
+    every worker thread gets its own browser.
+    """
+    browser = getattr(_local, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    if getattr(_local, "playwright", None) is None:
+        from playwright.sync_api import sync_playwright
+        _local.playwright = sync_playwright().start()
+        # atexit runs on the main thread, which can only stop its own driver
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(_close_browser)
+
+    _local.browser = _local.playwright.chromium.launch(
+        headless=True,
+        args=["--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox"]
+    )
+    return _local.browser
+
+
+def _close_browser() -> None:
+    """Close this thread's browser and stop its Playwright driver."""
+    try:
+        if getattr(_local, "browser", None) is not None:
+            _local.browser.close()
+        if getattr(_local, "playwright", None) is not None:
+            _local.playwright.stop()
+    except PlaywrightError as e:
+        logger.debug(f"Error closing browser: {e}")
+    finally:
+        _local.browser = None
+        _local.playwright = None
+
+
+register_thread_browser(_close_browser)
 
 
 def scrape_article_sync(
     url: str,
     session_dir: str,
-    base_url: str = "https://www.socialgrowthengineers.com"
+    base_url: str = "https://www.socialgrowthengineers.com",
+    jitter_ms: int = 0,
+    include_raw_json: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Scrape a single article synchronously using Playwright.
-    This function runs in a separate process.
+    This function runs in a worker thread, never on the event loop.
 
     Args:
         url: Article URL to scrape
         session_dir: Path to session directory containing storage_state.json
         base_url: Base URL of the site
+        jitter_ms: Upper bound of a random delay before navigating, so parallel
+            workers stay polite without serializing on a shared sleep
+        include_raw_json: Return the whole __NEXT_DATA__ blob as raw_json
+            instead of only the post metadata
 
     Returns:
         Dict with article data or None if failed
     """
-    from playwright.sync_api import sync_playwright
     from bs4 import BeautifulSoup
 
-    print(f"[SCRAPER] Scraping: {url}")
+    logger.info(f"Scraping: {url}")
 
     try:
-        with sync_playwright() as playwright:
-            # Check for storage state
-            storage_state_file = Path(session_dir) / "storage_state.json"
-            storage_state = str(storage_state_file) if storage_state_file.exists() else None
-
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=["--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox"]
-            )
+        # Check for storage state
+        storage_state_file = Path(session_dir) / "storage_state.json"
+        storage_state = str(storage_state_file) if storage_state_file.exists() else None
+
+        browser = _get_browser()
+        context = browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            storage_state=storage_state,
+        )
+        context.route("**/*", _block_non_essential)
+
+        try:
+            page = context.new_page()
+
+            if jitter_ms:
+                time.sleep(random.uniform(0, jitter_ms / 1000))
 
+            # Navigate to page - use domcontentloaded for faster loading
+            # networkidle can timeout on pages with video embeds
             try:
-                context = browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    storage_state=storage_state,
-                )
-                page = context.new_page()
-
-                # Navigate to page - use domcontentloaded for faster loading
-                # networkidle can timeout on pages with video embeds
-                try:
-                    page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                except Exception as e:
-                    print(f"[SCRAPER] Warning: domcontentloaded failed, retrying with load: {e}")
-                    page.goto(url, wait_until="load", timeout=60000)
-
-                # Wait for Next.js data to be available
-                try:
-                    page.wait_for_selector("#__NEXT_DATA__", timeout=10000)
-                except:
-                    pass
-
-                # Wait for content container
-                try:
-                    page.wait_for_selector("article, .article-content, .post-content, main", timeout=5000)
-                except:
-                    pass
-
-                # Extract __NEXT_DATA__
-                next_data = None
-                try:
-                    next_data_elem = page.query_selector("#__NEXT_DATA__")
-                    if next_data_elem:
-                        json_text = next_data_elem.inner_text()
-                        next_data = json.loads(json_text)
-                except Exception as e:
-                    print(f"[SCRAPER] Warning: Could not extract __NEXT_DATA__: {e}")
+                page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            except PlaywrightError as e:
+                logger.warning(f"domcontentloaded failed, retrying with load: {e}")
+                page.goto(url, wait_until="load", timeout=60000)
 
+            # Wait until both Next.js data and the content container exist
+            try:
+                page.wait_for_function(_PAGE_READY_JS, timeout=8000)
+            except PlaywrightTimeoutError:
+                pass
+
+            # Extract __NEXT_DATA__
+            next_data = None
+            try:
+                json_text = page.evaluate(_NEXT_DATA_TEXT_JS)
+                if json_text:
+                    next_data = json_loads(json_text)
+            except (PlaywrightError, ValueError) as e:
+                logger.warning(f"Could not extract __NEXT_DATA__: {e}")
+
+            extra_content_html = _extract_content_from_json(next_data)
+
+            if _has_complete_json(next_data, extra_content_html):
+                # Title and content are in __NEXT_DATA__: skip serializing and
+                # re-parsing the whole page, and scan only the article body.
+                article_data = _parse_article_sync(url, None, next_data, base_url, include_raw_json)
+                social_html = extra_content_html
+            else:
                 # Get HTML content
                 html_content = page.content()
                 soup = BeautifulSoup(html_content, "lxml")
 
                 # Parse article data
-                article_data = _parse_article_sync(url, soup, next_data, base_url)
-
-                # Extract social content
-                extra_content_html = _extract_content_from_json(next_data)
+                article_data = _parse_article_sync(url, soup, next_data, base_url, include_raw_json)
                 social_html = "\n".join([part for part in [html_content, extra_content_html] if part])
-                article_data["social_contents"] = _extract_social_contents(social_html)
-
-                # Capture screenshots for all social platforms
-                from .social_screenshot import capture_screenshots_for_article
-                from config.settings import settings
-                
-                article_data["social_contents"] = capture_screenshots_for_article(
-                    social_contents=article_data["social_contents"],
-                    output_dir=str(settings.screenshots_dir),
-                    article_slug=article_data.get("slug", "unknown")
-                )
-
-                print(f"[SCRAPER] Success: {article_data.get('title', url)[:50]}")
-                return article_data
-
-            finally:
-                browser.close()
-
-    except Exception as e:
-        import traceback
-        print(f"[SCRAPER] Error scraping {url}: {e}")
-        traceback.print_exc()
+
+            # Extract social content
+            article_data["social_contents"] = _extract_social_contents(social_html)
+
+            # Capture screenshots for all social platforms
+            from .social_screenshot import capture_screenshots_for_article
+            from config.settings import settings
+            
+            article_data["social_contents"] = capture_screenshots_for_article(
+                social_contents=article_data["social_contents"],
+                output_dir=str(settings.screenshots_dir),
+                article_slug=article_data.get("slug", "unknown")
+            )
+
+            logger.info(f"Success: {article_data.get('title', url)[:50]}")
+            return article_data
+
+        finally:
+            context.close()
+
+    except Exception:
+        logger.exception(f"Error scraping {url}")
         return None
 
 
+def _post_date_str(post: Dict) -> Optional[str]:
+    """Return the first date field set on a post, checking 'date' first (SGE uses it)."""
+    for field in _POST_DATE_FIELDS:
+        if post.get(field):
+            return post[field]
+    return None
+
+
+def _has_complete_json(next_data: Optional[Dict], content_html: Optional[str]) -> bool:
+    """
+    Check if __NEXT_DATA__ alone has the title, content and date of the article.
+
+    Without a parseable date the article would be dropped as off-date, so the
+    page HTML is loaded for its <time> fallback instead.
+    """
+    if not next_data or not content_html:
+        return False
+    page_props = next_data.get("props", {}).get("pageProps", {})
+    post = page_props.get("post") or page_props.get("article") or {}
+    if not post.get("title"):
+        return False
+    date_str = _post_date_str(post)
+    return isinstance(date_str, str) and _parse_date(date_str) is not None
+
+
 def _parse_article_sync(
     url: str,
-    soup: "BeautifulSoup",
+    soup: Optional["BeautifulSoup"],
     next_data: Optional[Dict],
-    base_url: str
+    base_url: str,
+    include_raw_json: bool = False
 ) -> Dict[str, Any]:
-    """Parse article data from HTML and JSON."""
+    """
+    Parse article data from HTML and JSON.
+
+    When soup is None only __NEXT_DATA__ is used and HTML fallbacks are skipped.
+    Unless include_raw_json is set, raw_json holds only the post object without
+    its content fields, which keeps the result small.
+    """
     slug = url.replace(base_url, "").strip("/")
 
     # Get pageProps from __NEXT_DATA__
@@ -150,13 +405,13 @@ def _parse_article_sync(
 
     # Extract title
     title = post.get("title")
-    if not title:
+    if not title and soup is not None:
         h1 = soup.find("h1")
         title = h1.get_text(strip=True) if h1 else "Untitled"
 
     # Extract subtitle
     subtitle = post.get("excerpt") or post.get("subtitle")
-    if not subtitle:
+    if not subtitle and soup is not None:
         meta_desc = soup.find("meta", {"name": "description"})
         if meta_desc and meta_desc.get("content"):
             subtitle = meta_desc["content"]
@@ -171,7 +426,7 @@ def _parse_article_sync(
         category = cat.get("name") or cat.get("title")
     elif cat:
         category = str(cat)
-    if not category:
+    if not category and soup is not None:
         cat_link = soup.select_one("a[href*='/category/']")
         if cat_link:
             category = cat_link.get_text(strip=True)
@@ -204,7 +459,7 @@ def _parse_article_sync(
             featured_image_url = img.get("url") or img.get("src")
         else:
             featured_image_url = str(img)
-    if not featured_image_url:
+    if not featured_image_url and soup is not None:
         og_image = soup.find("meta", {"property": "og:image"})
         if og_image and og_image.get("content"):
             featured_image_url = og_image["content"]
@@ -212,23 +467,16 @@ def _parse_article_sync(
     # Extract read time
     read_time = post.get("readTime")
 
-    # Extract published date - check 'date' field first (SGE uses this)
+    # Extract published date
     published_at = None
-    date_str = post.get("date") or post.get("publishedAt") or post.get("createdAt") or post.get("published_at") or post.get("created_at")
-    if not date_str:
+    date_str = _post_date_str(post)
+    if not date_str and soup is not None:
         time_elem = soup.find("time")
         if time_elem:
             date_str = time_elem.get("datetime") or time_elem.get_text(strip=True)
 
-    if date_str:
-        try:
-            published_at = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except:
-            try:
-                from dateutil import parser
-                published_at = parser.parse(date_str)
-            except:
-                pass
+    if isinstance(date_str, str) and date_str:
+        published_at = _parse_date(date_str)
 
     return {
         "sge_id": sge_id,
@@ -245,12 +493,45 @@ def _parse_article_sync(
         "featured_image_url": featured_image_url,
         "read_time": read_time,
         "published_at": published_at.isoformat() if published_at else None,
-        "raw_json": next_data,
+        "raw_json": next_data if include_raw_json else _compact_post_json(post),
         "social_contents": [],
     }
 
 
-def _extract_content_sync(soup: "BeautifulSoup", page_props: Dict) -> Tuple[Optional[str], Optional[str]]:
+def _compact_post_json(post: Dict) -> Optional[Dict]:
+    """Post metadata from __NEXT_DATA__ without the (already extracted) body."""
+    if not post:
+        return None
+    return {k: v for k, v in post.items() if k not in _POST_CONTENT_KEYS}
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a publish date, trying ISO-8601 and known formats before dateutil.
+
+    Cached because bulk imports see the same timestamps many times.
+    """
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+
+    for fmt in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        return parsed.replace(tzinfo=timezone.utc) if fmt.endswith("Z") else parsed
+
+    try:
+        from dateutil import parser
+        return parser.parse(date_str)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _extract_content_sync(soup: Optional["BeautifulSoup"], page_props: Dict) -> Tuple[Optional[str], Optional[str]]:
     """Extract article content as HTML and plain text."""
     from bs4 import BeautifulSoup as BS
 
@@ -273,6 +554,9 @@ def _extract_content_sync(soup: "BeautifulSoup", page_props: Dict) -> Tuple[Opti
             content_text = BS(candidate, "lxml").get_text(separator="\n", strip=True)
             return candidate, content_text
 
+    if soup is None:
+        return None, None
+
     # Fallback to DOM
     selectors = [
         "article .content",
@@ -315,217 +599,266 @@ def _extract_content_from_json(next_data: Optional[Dict]) -> Optional[str]:
 
 
 def _fetch_sge_embed_details(embed_id: str) -> Optional[Dict[str, Any]]:
-    """Fetch video details from SGE embed API."""
-    import requests
+    """Fetch video details from SGE embed API, reusing recent results."""
+    cached = _embed_details_cache.get(embed_id)
+    if cached is not None:
+        return cached
 
     try:
         api_url = f"https://www.socialgrowthengineers.com/api/embed/video/{embed_id}"
-        response = requests.get(api_url, timeout=10)
+        response = get_http_session().get(api_url, timeout=10)
         if response.status_code == 200:
-            return response.json()
-    except Exception as e:
-        print(f"[SCRAPER] Warning: Could not fetch embed details for {embed_id}: {e}")
+            details = response_json(response)
+            _embed_details_cache.set(embed_id, details)
+            return details
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"Could not fetch embed details for {embed_id}: {e}")
+    return None
+
+
+def _parse_social_html(html: str):
+    """Parse HTML with selectolax when installed, else BeautifulSoup/lxml."""
+    if HTMLParser is not None:
+        return HTMLParser(html)
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "lxml")
+
+
+def _attr(node, name: str) -> str:
+    """Read an attribute of a selectolax or BeautifulSoup node as a string."""
+    if HTMLParser is not None:
+        value = node.attributes.get(name)
+    else:
+        value = node.get(name)
+        if isinstance(value, list):  # multi-valued attributes such as class
+            value = " ".join(value)
+    return value or ""
+
+
+def _iter_tags(tree, names: frozenset):
+    """Yield tags with the given names in document order, in a single pass."""
+    if HTMLParser is not None:
+        if tree.root is None:
+            return
+        for node in tree.root.traverse():
+            if node.tag in names:
+                yield node
+    else:
+        yield from tree.find_all(list(names))
+
+
+def _tag_name(node) -> str:
+    """Tag name of a selectolax or BeautifulSoup node."""
+    return node.tag if HTMLParser is not None else node.name
+
+
+def _find_first(tree, tag: str, attr: str, pattern: "re.Pattern"):
+    """Find the first tag whose attribute matches pattern."""
+    nodes = tree.css(tag) if HTMLParser is not None else tree.find_all(tag)
+    for node in nodes:
+        if pattern.search(_attr(node, attr)):
+            return node
     return None
 
 
+def _outer_html(node) -> str:
+    """Serialize a node back to HTML."""
+    return node.html if HTMLParser is not None else str(node)
+
+
+def _fetch_sge_embed_details_many(embed_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch details for several SGE embeds concurrently.
+
+    Each lookup is an independent blocking GET, so K embeds cost roughly one
+    round trip instead of K. Duplicate IDs are fetched once.
+    """
+    unique_ids = list(dict.fromkeys(embed_ids))
+    if len(unique_ids) <= 1:
+        return {embed_id: _fetch_sge_embed_details(embed_id) for embed_id in unique_ids}
+    with ThreadPoolExecutor(max_workers=min(len(unique_ids), 8)) as ex:
+        return dict(zip(unique_ids, ex.map(_fetch_sge_embed_details, unique_ids)))
+
+
+def _sge_embed_content(
+    src: str,
+    iframe,
+    embed_id: Optional[str],
+    embed_details: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build social content for an SGE-hosted video embed, resolving the real video."""
+    if embed_id and embed_details:
+        # Use actual TikTok URL and details
+        video_url = embed_details.get("video_url", src)
+        video_id = embed_details.get("video_id")
+        platform = embed_details.get("platform", "tiktok")
+        video_details = embed_details.get("video_details", {})
+
+        # Extract stats from video_details
+        item_struct = video_details.get("itemInfo", {}).get("itemStruct", {})
+        stats = item_struct.get("stats", {})
+        author = item_struct.get("author", {})
+
+        return {
+            "platform": platform,
+            "content_type": "video",
+            "url": video_url,
+            "video_id": video_id,
+            "embed_id": embed_id,
+            "embed_html": _outer_html(iframe),
+            "username": author.get("uniqueId"),
+            "caption": item_struct.get("desc"),
+            "thumbnail_url": item_struct.get("video", {}).get("cover"),
+            "stats": {
+                "views": stats.get("playCount"),
+                "likes": stats.get("diggCount"),
+                "comments": stats.get("commentCount"),
+                "shares": stats.get("shareCount"),
+            } if stats else None,
+        }
+
+    # Fallback if API fetch fails
+    return {
+        "platform": "tiktok",
+        "content_type": "video",
+        "url": src,
+        "embed_html": _outer_html(iframe),
+    }
+
+
+def _normalize_social_url(url: str) -> str:
+    """
+    Canonical form of a social URL used as the dedup key.
+
+    Lowercases the host and drops www./m., trailing slashes, fragments and
+    query parameters other than video id (v) and timestamp (t).
+    """
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    host = parts.netloc.lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    query = "&".join(
+        f"{key}={value}"
+        for key, value in parse_qsl(parts.query)
+        if key in _SOCIAL_QUERY_KEYS
+    )
+    normalized = f"{host}{parts.path.rstrip('/')}"
+    return f"{normalized}?{query}" if query else normalized
+
+
+def _link_content_type(platform: str, href: str) -> str:
+    """Determine content type of a social link from its URL."""
+    if platform == "tiktok":
+        if "/music/" in href:
+            return "sound"
+        if "/@" in href and "/video/" not in href:
+            return "profile"
+        return "video"
+    if platform == "instagram":
+        if "/reel/" in href:
+            return "reel"
+        if "/tv/" in href:
+            return "igtv"
+        return "post"
+    if platform == "twitter":
+        return "tweet"
+    return "video"
+
+
 def _extract_social_contents(html: str) -> List[Dict[str, Any]]:
-    """Extract social media content from HTML."""
-    from bs4 import BeautifulSoup as BS
-    import re
+    """
+    Extract social media content from HTML.
+
+    Iframes, links and embed blockquotes are classified in one pass over the
+    DOM, so positions follow document order.
+    """
+    if not html or not _RE_SOCIAL_ANY.search(html):
+        return []
 
     social_contents = []
-    soup = BS(html, "lxml")
-    position = 0
-    seen_urls = set()  # Avoid duplicates
-
-    # SGE Custom Video Embeds (TikTok videos hosted on SGE)
-    sge_video_iframes = soup.find_all("iframe", src=re.compile(r"/embed/video/", re.I))
-    for iframe in sge_video_iframes:
-        src = iframe.get("src", "")
-        if src and src not in seen_urls:
-            seen_urls.add(src)
-
-            # Extract embed ID and fetch real video details
-            embed_id_match = re.search(r"/embed/video/([a-f0-9-]+)", src, re.I)
-            if embed_id_match:
-                embed_id = embed_id_match.group(1)
-                embed_details = _fetch_sge_embed_details(embed_id)
-
-                if embed_details:
-                    # Use actual TikTok URL and details
-                    video_url = embed_details.get("video_url", src)
-                    video_id = embed_details.get("video_id")
-                    platform = embed_details.get("platform", "tiktok")
-                    video_details = embed_details.get("video_details", {})
-
-                    # Extract stats from video_details
-                    item_struct = video_details.get("itemInfo", {}).get("itemStruct", {})
-                    stats = item_struct.get("stats", {})
-                    author = item_struct.get("author", {})
-
-                    social_contents.append({
-                        "platform": platform,
-                        "content_type": "video",
-                        "url": video_url,
-                        "video_id": video_id,
-                        "embed_id": embed_id,
-                        "embed_html": str(iframe),
-                        "username": author.get("uniqueId"),
-                        "caption": item_struct.get("desc"),
-                        "thumbnail_url": item_struct.get("video", {}).get("cover"),
-                        "stats": {
-                            "views": stats.get("playCount"),
-                            "likes": stats.get("diggCount"),
-                            "comments": stats.get("commentCount"),
-                            "shares": stats.get("shareCount"),
-                        } if stats else None,
-                        "position_in_article": position,
-                    })
-                    position += 1
-                    continue
-
-            # Fallback if API fetch fails
-            social_contents.append({
-                "platform": "tiktok",
-                "content_type": "video",
-                "url": src,
-                "embed_html": str(iframe),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # TikTok iframes (direct embeds)
-    tiktok_iframes = soup.find_all("iframe", src=re.compile(r"tiktok\.com", re.I))
-    for iframe in tiktok_iframes:
-        src = iframe.get("src", "")
-        if src and src not in seen_urls:
-            seen_urls.add(src)
-            social_contents.append({
-                "platform": "tiktok",
-                "content_type": "video",
-                "url": src,
-                "embed_html": str(iframe),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # TikTok links (in <a> tags)
-    tiktok_links = soup.find_all("a", href=re.compile(r"tiktok\.com", re.I))
-    for link in tiktok_links:
-        href = link.get("href", "")
-        if href and href not in seen_urls:
-            seen_urls.add(href)
-            # Determine content type from URL
-            content_type = "video"
-            if "/music/" in href:
-                content_type = "sound"
-            elif "/@" in href and "/video/" not in href:
-                content_type = "profile"
-            social_contents.append({
-                "platform": "tiktok",
-                "content_type": content_type,
-                "url": href,
-                "embed_html": str(link),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # Instagram blockquotes (embeds)
-    ig_blockquotes = soup.find_all("blockquote", class_=re.compile(r"instagram", re.I))
-    for bq in ig_blockquotes:
-        link = bq.find("a", href=re.compile(r"instagram\.com", re.I))
-        url = link.get("href") if link else None
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            social_contents.append({
-                "platform": "instagram",
-                "content_type": "post",
-                "url": url,
-                "embed_html": str(bq),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # Instagram links (in <a> tags)
-    ig_links = soup.find_all("a", href=re.compile(r"instagram\.com/(p|reel|tv)/", re.I))
-    for link in ig_links:
-        href = link.get("href", "")
-        if href and href not in seen_urls:
-            seen_urls.add(href)
-            content_type = "post"
-            if "/reel/" in href:
-                content_type = "reel"
-            elif "/tv/" in href:
-                content_type = "igtv"
-            social_contents.append({
-                "platform": "instagram",
-                "content_type": content_type,
+    pending_sge = []  # (position, src, iframe, embed_id) resolved after the pass
+    tree = _parse_social_html(html)
+    seen_urls = set()  # Normalized URLs, so variants of one post are kept once
+
+    for node in _iter_tags(tree, _SOCIAL_TAGS):
+        tag = _tag_name(node)
+
+        if tag == "iframe":
+            src = _attr(node, "src")
+            match = _RE_IFRAME_SRC.search(src)
+            if not match:
+                continue
+            key = _normalize_social_url(src)
+            if key in seen_urls:
+                continue
+            seen_urls.add(key)
+
+            if match.lastgroup == "sge":
+                # SGE Custom Video Embeds (TikTok videos hosted on SGE);
+                # resolved after the pass so embed lookups can run together
+                embed_id_match = _RE_SGE_EMBED_ID.search(src)
+                embed_id = embed_id_match.group(1) if embed_id_match else None
+                pending_sge.append((len(social_contents), src, node, embed_id))
+                content = {}
+            else:
+                content = {
+                    "platform": match.lastgroup,
+                    "content_type": "video",
+                    "url": src,
+                    "embed_html": _outer_html(node),
+                }
+
+        elif tag == "a":
+            href = _attr(node, "href")
+            match = _RE_LINK_HREF.search(href)
+            if not match:
+                continue
+            key = _normalize_social_url(href)
+            if key in seen_urls:
+                continue
+            seen_urls.add(key)
+            content = {
+                "platform": match.lastgroup,
+                "content_type": _link_content_type(match.lastgroup, href),
                 "url": href,
-                "embed_html": str(link),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # Twitter/X blockquotes (embeds)
-    twitter_blockquotes = soup.find_all("blockquote", class_=re.compile(r"twitter", re.I))
-    for bq in twitter_blockquotes:
-        link = bq.find("a", href=re.compile(r"(twitter|x)\.com", re.I))
-        url = link.get("href") if link else None
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            social_contents.append({
-                "platform": "twitter",
-                "content_type": "tweet",
+                "embed_html": _outer_html(node),
+            }
+
+        else:
+            # Instagram / Twitter embed blockquotes
+            match = _RE_BLOCKQUOTE_CLASS.search(_attr(node, "class"))
+            if not match:
+                continue
+            platform = match.lastgroup
+            host_re = _RE_IG_HOST if platform == "instagram" else _RE_TWITTER_HOST
+            link = _find_first(node, "a", "href", host_re)
+            url = _attr(link, "href") if link else None
+            if not url:
+                continue
+            key = _normalize_social_url(url)
+            if key in seen_urls:
+                continue
+            seen_urls.add(key)
+            content = {
+                "platform": platform,
+                "content_type": "post" if platform == "instagram" else "tweet",
                 "url": url,
-                "embed_html": str(bq),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # Twitter/X links (in <a> tags)
-    twitter_links = soup.find_all("a", href=re.compile(r"(twitter|x)\.com/\w+/status/", re.I))
-    for link in twitter_links:
-        href = link.get("href", "")
-        if href and href not in seen_urls:
-            seen_urls.add(href)
-            social_contents.append({
-                "platform": "twitter",
-                "content_type": "tweet",
-                "url": href,
-                "embed_html": str(link),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # YouTube iframes
-    yt_iframes = soup.find_all("iframe", src=re.compile(r"youtube\.com|youtu\.be", re.I))
-    for iframe in yt_iframes:
-        src = iframe.get("src", "")
-        if src and src not in seen_urls:
-            seen_urls.add(src)
-            social_contents.append({
-                "platform": "youtube",
-                "content_type": "video",
-                "url": src,
-                "embed_html": str(iframe),
-                "position_in_article": position,
-            })
-            position += 1
-
-    # YouTube links (in <a> tags)
-    yt_links = soup.find_all("a", href=re.compile(r"(youtube\.com/watch|youtu\.be/)", re.I))
-    for link in yt_links:
-        href = link.get("href", "")
-        if href and href not in seen_urls:
-            seen_urls.add(href)
-            social_contents.append({
-                "platform": "youtube",
-                "content_type": "video",
-                "url": href,
-                "embed_html": str(link),
-                "position_in_article": position,
-            })
-            position += 1
+                "embed_html": _outer_html(node),
+            }
+
+        content["position_in_article"] = len(social_contents)
+        social_contents.append(content)
+
+    if pending_sge:
+        details = _fetch_sge_embed_details_many(
+            [embed_id for _, _, _, embed_id in pending_sge if embed_id]
+        )
+        for position, src, node, embed_id in pending_sge:
+            content = _sge_embed_content(src, node, embed_id, details.get(embed_id))
+            content["position_in_article"] = position
+            social_contents[position] = content
 
     return social_contents
 
@@ -534,32 +867,42 @@ def scrape_articles_batch_sync(
     urls: List[str],
     session_dir: str,
     base_url: str = "https://www.socialgrowthengineers.com",
-    delay_ms: int = 2000
+    delay_ms: int = 2000,
+    max_workers: Optional[int] = None,
+    include_raw_json: bool = False
 ) -> List[Dict[str, Any]]:
     """
-    Scrape multiple articles synchronously.
+    Scrape multiple articles in parallel worker threads.
 
     Args:
         urls: List of article URLs to scrape
         session_dir: Path to session directory
         base_url: Base URL of the site
-        delay_ms: Delay between articles in milliseconds
+        delay_ms: Max random delay each worker waits before loading an article
+        max_workers: Worker thread count (default: settings.scrape_workers)
+        include_raw_json: Return the whole __NEXT_DATA__ blob for each article
 
     Returns:
-        List of article data dicts (or None for failed articles)
+        List of article data dicts (or None for failed articles), in input order
     """
-    import time
-
-    results = []
-
-    for i, url in enumerate(urls):
-        print(f"[SCRAPER] Processing {i+1}/{len(urls)}: {url}")
-
-        result = scrape_article_sync(url, session_dir, base_url)
-        results.append(result)
+    executor = _get_batch_executor(max_workers)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+
+    futures = {
+        executor.submit(
+            scrape_article_sync, url, session_dir, base_url, delay_ms, include_raw_json
+        ): i
+        for i, url in enumerate(urls)
+    }
 
-        # Delay between articles
-        if i < len(urls) - 1:
-            time.sleep(delay_ms / 1000)
+    for done, future in enumerate(as_completed(futures), 1):
+        i = futures[future]
+        try:
+            results[i] = future.result()
+        except Exception as e:
+            logger.error(f"Error scraping {urls[i]}: {e}")
+        logger.info(f"Processed {done}/{len(urls)}: {urls[i]}")
 
+    # Idle worker threads would otherwise keep their Chromium running
+    close_executor_browsers(executor, _batch_workers)
     return results
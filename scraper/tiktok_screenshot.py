@@ -1,14 +1,122 @@
 """TikTok screenshot capture with oEmbed fallback."""
+import atexit
 import hashlib
 import json
 import os
 import random
-import re
+import tempfile
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from typing import Optional, Tuple
-import requests
+
+from PIL import Image
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from config.logging_config import get_logger
+
+from .http_session import content_digest
+from .social_screenshot import download_thumbnail, fetch_tiktok_oembed
+from .sync_scraper import _is_tracker, register_thread_browser
+
+logger = get_logger()
+
+# True once the first <video> has decoded enough data to paint a frame
+_VIDEO_READY_JS = (
+    "() => { const v = document.querySelector('video'); "
+    "return v !== null && v.readyState >= 2; }"
+)
+
+# Looks for TikTok's verification widgets, then scans visible text only, so
+# the full serialized page is never pulled into Python
+_CAPTCHA_CHECK_JS = (
+    "() => { if (document.querySelector('.captcha_verify_container, "
+    "#tiktok-verify-ele, [class*=\"captcha\"]')) return true; "
+    "const t = (document.body ? document.body.innerText : '').toLowerCase(); "
+    "return t.includes('captcha') || t.includes('verify'); }"
+)
+
+# Playwright driver and browser shared by every TikTok capture in a thread
+_local = threading.local()
+
+# Pillow releases the GIL while encoding, so WebP encoding runs beside Playwright
+_encode_executor = None
+
+
+def _get_browser():
+    """
+    Get or launch the headless Chromium reused for TikTok captures.
+
+    Each capture gets its own mobile context; only the browser is shared,
+    per thread, since Playwright's sync API is bound to the thread that started it.
+    """
+    browser = getattr(_local, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    if getattr(_local, "playwright", None) is None:
+        from playwright.sync_api import sync_playwright
+        _local.playwright = sync_playwright().start()
+        # atexit runs on the main thread, which can only stop its own driver
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(_close_browser)
+
+    _local.browser = _local.playwright.chromium.launch(
+        headless=True,
+        args=[
+            "--disable-gpu",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+            "--disable-blink-features=AutomationControlled",
+        ]
+    )
+    return _local.browser
+
+
+def _close_browser() -> None:
+    """Close this thread's browser and stop its Playwright driver."""
+    try:
+        if getattr(_local, "browser", None) is not None:
+            _local.browser.close()
+        if getattr(_local, "playwright", None) is not None:
+            _local.playwright.stop()
+    except PlaywrightError as e:
+        logger.debug(f"Error closing browser: {e}")
+    finally:
+        _local.browser = None
+        _local.playwright = None
+
+
+# Worker threads close their capture browser along with the scrape browser
+register_thread_browser(_close_browser)
+
+
+def _get_encode_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool that encodes screenshots."""
+    global _encode_executor
+    if _encode_executor is None:
+        _encode_executor = ThreadPoolExecutor(max_workers=2)
+        atexit.register(_encode_executor.shutdown)
+    return _encode_executor
+
+
+def _save_webp(png_bytes: bytes, filepath: Path) -> None:
+    """
+    Re-encode a PNG screenshot as WebP with Pillow.
+
+    Encodes to a temp file and renames it into place, so the exists check
+    never sees a truncated file and concurrent captures cannot interleave.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f, Image.open(BytesIO(png_bytes)) as img:
+            img.save(f, "WEBP", quality=85, method=4)
+        os.replace(tmp_name, filepath)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 def fetch_oembed_data(url: str) -> Optional[dict]:
@@ -21,14 +129,7 @@ def fetch_oembed_data(url: str) -> Optional[dict]:
     Returns:
         Dict with title, author_name, thumbnail_url, etc. or None if failed
     """
-    try:
-        oembed_url = f"https://www.tiktok.com/oembed?url={url}"
-        response = requests.get(oembed_url, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-    except Exception as e:
-        print(f"[TIKTOK] oEmbed fetch error: {e}")
-    return None
+    return fetch_tiktok_oembed(url)
 
 
 def download_oembed_thumbnail(
@@ -51,28 +152,7 @@ def download_oembed_thumbnail(
     if not thumbnail_url:
         return None
     
-    try:
-        response = requests.get(thumbnail_url, timeout=15)
-        if response.status_code == 200:
-            # Create output directory
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_slug = re.sub(r'[^\w\-]', '_', article_slug)[:50]
-            filename = f"{safe_slug}_{index}_{timestamp}_oembed.jpg"
-            filepath = output_path / filename
-            
-            with open(filepath, "wb") as f:
-                f.write(response.content)
-            
-            print(f"[TIKTOK] Downloaded oEmbed thumbnail: {filename}")
-            return str(filepath)
-    except Exception as e:
-        print(f"[TIKTOK] Thumbnail download error: {e}")
-    
-    return None
+    return download_thumbnail(thumbnail_url, output_dir, article_slug, "tiktok", index)
 
 
 def capture_tiktok_screenshot_sync(
@@ -96,95 +176,92 @@ def capture_tiktok_screenshot_sync(
     Returns:
         Tuple of (path, source) where source is 'screenshot' or 'oembed' or 'failed'
     """
-    from playwright.sync_api import sync_playwright
-    
     # Check for TikTok session
     storage_state_file = Path(session_dir) / "tiktok_storage_state.json"
     has_session = storage_state_file.exists()
     
     if not has_session:
-        print(f"[TIKTOK] No session found, falling back to oEmbed for: {url}")
+        logger.info(f"No TikTok session found, falling back to oEmbed for: {url}")
         thumbnail_path = download_oembed_thumbnail(url, output_dir, article_slug, index)
         if thumbnail_path:
             return thumbnail_path, "oembed"
         return None, "failed"
     
-    print(f"[TIKTOK] Capturing screenshot: {url}")
+    logger.info(f"Capturing TikTok screenshot: {url}")
     
     try:
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-gpu",
-                    "--disable-dev-shm-usage",
-                    "--no-sandbox",
-                    "--disable-blink-features=AutomationControlled",
-                ]
-            )
+        browser = _get_browser()
+        context = browser.new_context(
+            viewport={"width": 375, "height": 667},  # Mobile viewport
+            user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1",
+            storage_state=str(storage_state_file),
+        )
+        # The screenshot needs visuals, so only trackers are blocked here
+        context.route(
+            "**/*",
+            lambda route: route.abort() if _is_tracker(route.request.url) else route.continue_()
+        )
+        encode_future = None
+        try:
+            page = context.new_page()
+            
+            # Random delay to avoid detection
+            delay = random.uniform(2, 5)
+            time.sleep(delay)
+            
+            # Navigate to TikTok video
             try:
-                context = browser.new_context(
-                    viewport={"width": 375, "height": 667},  # Mobile viewport
-                    user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1",
-                    storage_state=str(storage_state_file),
+                page.goto(url, wait_until="domcontentloaded", timeout=20000)
+            except PlaywrightError as e:
+                logger.warning(f"TikTok navigation failed, retrying: {e}")
+                page.goto(url, wait_until="load", timeout=30000)
+            
+            # Wait for the video to have a frame rather than a fixed delay
+            try:
+                page.wait_for_function(_VIDEO_READY_JS, timeout=5000)
+            except PlaywrightTimeoutError:
+                page.wait_for_timeout(500)
+            
+            # Check for captcha or login wall
+            if page.evaluate(_CAPTCHA_CHECK_JS):
+                logger.warning("TikTok captcha detected, falling back to oEmbed")
+                thumbnail_path = download_oembed_thumbnail(url, output_dir, article_slug, index)
+                if thumbnail_path:
+                    return thumbnail_path, "oembed"
+                return None, "failed"
+            
+            # Wait for video card
+            try:
+                page.wait_for_selector(
+                    '[data-e2e="browse-video"], video, .video-card, .tiktok-web-player',
+                    timeout=10000
                 )
-                page = context.new_page()
-                
-                # Random delay to avoid detection
-                delay = random.uniform(2, 5)
-                time.sleep(delay)
-                
-                # Navigate to TikTok video
-                try:
-                    page.goto(url, wait_until="domcontentloaded", timeout=20000)
-                except Exception as e:
-                    print(f"[TIKTOK] Navigation timeout, retrying: {e}")
-                    page.goto(url, wait_until="load", timeout=30000)
-                
-                # Wait for video content to load
-                page.wait_for_timeout(3000)
-                
-                # Check for captcha or login wall
-                page_content = page.content().lower()
-                if "captcha" in page_content or "verify" in page_content:
-                    print(f"[TIKTOK] Captcha detected, falling back to oEmbed")
-                    thumbnail_path = download_oembed_thumbnail(url, output_dir, article_slug, index)
-                    if thumbnail_path:
-                        return thumbnail_path, "oembed"
-                    return None, "failed"
-                
-                # Wait for video card
-                try:
-                    page.wait_for_selector(
-                        '[data-e2e="browse-video"], video, .video-card, .tiktok-web-player',
-                        timeout=10000
-                    )
-                except:
-                    pass  # Continue anyway
-                
-                # Create output directory
-                output_path = Path(output_dir)
-                output_path.mkdir(parents=True, exist_ok=True)
-                
-                # Generate filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_slug = re.sub(r'[^\w\-]', '_', article_slug)[:50]
-                filename = f"{safe_slug}_{index}_{timestamp}.webp"
-                filepath = output_path / filename
-                
-                # Take screenshot
-                page.screenshot(path=str(filepath), type="webp", quality=85)
-                print(f"[TIKTOK] Screenshot saved: {filename}")
-                
-                return str(filepath), "screenshot"
-                
-            finally:
-                browser.close()
-                
-    except Exception as e:
-        print(f"[TIKTOK] Screenshot error: {e}, falling back to oEmbed")
-        import traceback
-        traceback.print_exc()
+            except PlaywrightTimeoutError:
+                pass  # Continue anyway
+            
+            # Create output directory
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            
+            # Capture PNG (Chromium's fastest path) and encode WebP off-thread,
+            # named by the PNG's hash so an identical capture is not re-encoded
+            png_bytes = page.screenshot(type="png")
+            filename = f"{content_digest(png_bytes).hexdigest()}.webp"
+            filepath = output_path / filename
+            if not filepath.exists():
+                encode_future = _get_encode_executor().submit(_save_webp, png_bytes, filepath)
+            
+        finally:
+            context.close()
+        
+        # Encoding overlapped with the context teardown above
+        if encode_future is not None:
+            encode_future.result()
+        logger.info(f"TikTok screenshot saved: {filename}")
+        return str(filepath), "screenshot"
+            
+    except Exception:
+        logger.exception("TikTok screenshot error, falling back to oEmbed")
         
         # Fallback to oEmbed
         thumbnail_path = download_oembed_thumbnail(url, output_dir, article_slug, index)
@@ -1,322 +1,501 @@
 """Authentication service for SGE website login."""
 import asyncio
-import json
+import base64
 import os
+import re
 import sys
-import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
+from functools import lru_cache
 from typing import Optional, Tuple
-from playwright.async_api import Page, BrowserContext
+from playwright.async_api import (
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+)
 
 from config.settings import settings
 from config.logging_config import get_logger
+from utils.helpers import json_dumps, json_loads, read_json_file, write_json_file
+
+logger = get_logger()
+
+_EMAIL_INPUT_SELECTOR = 'input[type="email"], input[name="email"], input[placeholder*="email" i]'
+_CODE_INPUT_SELECTOR = (
+    'input[name="code"], input[type="text"][maxlength="6"], '
+    'input[placeholder*="code" i], input[placeholder*="verification" i], '
+    'input[autocomplete="one-time-code"]'
+)
+
+# Code input selectors, one query per tier: a selector list matches in
+# document order, so the generic fallbacks get their own tier
+_CODE_SELECTOR_TIERS = (
+    ", ".join([
+        'input[name="code"]',
+        'input[name="token"]',
+        'input[name="otp"]',
+        'input[name="verification"]',
+        'input[type="text"][maxlength="6"]',
+        'input[type="text"][maxlength="4"]',
+        'input[type="number"][maxlength="6"]',
+        'input[placeholder*="code" i]',
+        'input[placeholder*="verification" i]',
+        'input[placeholder*="otp" i]',
+        'input[placeholder*="token" i]',
+        'input[autocomplete="one-time-code"]',
+    ]),
+    ", ".join([
+        'input[type="number"]',
+        'input[type="text"]:not([name="email"]):not([type="email"])',
+        'input[type="tel"]',
+    ]),
+)
+
+# Verify button selectors: submit buttons, then labelled buttons, then any button
+_VERIFY_BUTTON_TIERS = (
+    'button[type="submit"], input[type="submit"]',
+    ", ".join([
+        'button:has-text("Verify")',
+        'button:has-text("Submit")',
+        'button:has-text("Login")',
+        'button:has-text("Sign in")',
+        'button:has-text("Continue")',
+    ]),
+    'button',
+)
+
+# Any of these on the page means the user is logged in
+_LOGGED_IN_SELECTOR = ", ".join([
+    'button:has-text("Logout")',
+    'button:has-text("Sign out")',
+    'a:has-text("Logout")',
+    'a:has-text("Sign out")',
+    '[data-testid="user-menu"]',
+    '.user-avatar',
+    '.user-profile',
+    'a[href*="dashboard"]',
+    'a[href*="account"]',
+])
+
+# Browser launch and context options shared by every login
+_LAUNCH_ARGS = ("--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox")
+_VIEWPORT = {"width": 1920, "height": 1080}
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Browser state of a login waiting for its code, so verification can resume it
+_PENDING_STORAGE_FILE = "pending_storage.json"
+
+# Lifetime of a saved browser session and of a pending login code request
+SESSION_TTL_SECONDS = 7 * 24 * 3600
+LOGIN_STATE_TTL_SECONDS = 10 * 60
+
+# Text shown once the site has sent a login code
+_CODE_PAGE_HINT = re.compile(r"verification|check your email|code|one-time", re.I)
+
+# Describes each input matched by a locator, in match order
+_DESCRIBE_INPUTS_JS = "els => els.map(e => ({type: e.type, name: e.name, placeholder: e.placeholder}))"
+
+# Browser shared by every login on this event loop. It is relaunched after
+# BROWSER_POOL_RECYCLE_AFTER contexts, once no login is still using it.
+_playwright = None
+_browser = None
+_browser_lock: Optional[asyncio.Lock] = None
+_contexts_served = 0
+_active_contexts = 0
+
+
+def _get_browser_lock() -> asyncio.Lock:
+    """Get the browser lock, creating it on first use inside the running loop."""
+    global _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    return _browser_lock
+
+
+async def _ensure_browser() -> None:
+    """Launch the shared browser if it is not running. Caller holds the lock."""
+    global _playwright, _browser, _contexts_served
+    if _browser is None:
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(
+            headless=True,
+            args=list(_LAUNCH_ARGS)
+        )
+        _contexts_served = 0
 
-# Process pool for running Playwright in separate process (Windows compatibility)
-_executor = None
 
-def _get_executor():
-    """Get or create process pool executor."""
-    global _executor
-    if _executor is None:
-        _executor = ProcessPoolExecutor(max_workers=2)
-    return _executor
+async def start_login_browser() -> None:
+    """Launch the shared login browser ahead of the first login."""
+    async with _get_browser_lock():
+        await _ensure_browser()
 
 
-def _run_playwright_request_code(email: str, login_url: str, session_dir: str) -> Tuple[bool, str]:
+async def close_login_browser() -> None:
+    """Close the shared login browser and stop Playwright."""
+    global _playwright, _browser
+    async with _get_browser_lock():
+        try:
+            if _browser is not None:
+                await _browser.close()
+            if _playwright is not None:
+                await _playwright.stop()
+        except PlaywrightError as e:
+            logger.debug(f"Error closing login browser: {e}")
+        finally:
+            _browser = None
+            _playwright = None
+
+
+async def _new_login_context(storage_state: Optional[str] = None) -> BrowserContext:
+    """Open a context on the shared browser, launching or recycling it as needed."""
+    global _browser, _contexts_served, _active_contexts
+    async with _get_browser_lock():
+        stale = _browser is not None and (
+            not _browser.is_connected()
+            or (_contexts_served >= settings.browser_pool_recycle_after and _active_contexts == 0)
+        )
+        if stale:
+            try:
+                await _browser.close()
+            except PlaywrightError as e:
+                logger.debug(f"Error closing stale login browser: {e}")
+            _browser = None
+
+        await _ensure_browser()
+        _contexts_served += 1
+        _active_contexts += 1
+        browser = _browser
+
+    try:
+        return await browser.new_context(
+            viewport=_VIEWPORT,
+            user_agent=_USER_AGENT,
+            storage_state=storage_state,
+        )
+    except Exception:
+        _active_contexts -= 1
+        raise
+
+
+def _session_data(email: str, storage_state: dict) -> dict:
+    """Session metadata for session_data.json: cookies only, not the whole storage state."""
+    now = time.time()
+    return {
+        "email": email,
+        "cookies": storage_state.get("cookies", []),
+        "origins_count": len(storage_state.get("origins", [])),
+        "saved_at": datetime.fromtimestamp(now).isoformat(),
+        "expires_at": datetime.fromtimestamp(now + SESSION_TTL_SECONDS).isoformat(),
+        "expires_at_ts": now + SESSION_TTL_SECONDS,
+    }
+
+
+@lru_cache(maxsize=128)
+def _extract_jwt_email(token: str) -> str:
+    """Read the email claim from a JWT's payload without verifying it."""
+    try:
+        # JWT format: header.payload.signature, base64url without padding;
+        # surplus padding is ignored by the decoder
+        payload = token.split('.')[1]
+        token_data = json_loads(base64.urlsafe_b64decode(payload + '=='))
+        return token_data.get('email', 'unknown@email.com')
+    except (IndexError, ValueError, AttributeError):
+        return 'unknown@email.com'
+
+
+def _login_state(email: str, status: str) -> dict:
+    """Pending-login state written to login_state.json."""
+    now = time.time()
+    return {
+        "email": email,
+        "status": status,
+        "timestamp": datetime.fromtimestamp(now).isoformat(),
+        "timestamp_ts": now,
+    }
+
+
+def _session_expired(session_data: dict) -> bool:
     """
-    Run Playwright in separate process to request login code.
-    This function runs in a separate process to avoid Windows asyncio issues.
+    Check session expiry with a float compare where possible.
+
+    Token sessions store expires_at as a unix timestamp and newer cookie
+    sessions store expires_at_ts; older files only have an ISO string.
     """
-    from playwright.sync_api import sync_playwright
-    import json
-    from datetime import datetime
-    from pathlib import Path
+    expires_at_ts = session_data.get("expires_at_ts")
+    if expires_at_ts is None:
+        expires_at = session_data.get("expires_at")
+        if isinstance(expires_at, (int, float)):
+            expires_at_ts = expires_at
+        elif expires_at:
+            try:
+                expires_at_ts = datetime.fromisoformat(expires_at).timestamp()
+            except (ValueError, TypeError):
+                return False
+        else:
+            return False
+    return time.time() > expires_at_ts
 
-    print(f"[PROCESS] Starting Playwright for {email}...")
 
+async def _wait_for(waiter):
+    """Await a Playwright wait, returning None instead of raising on timeout."""
     try:
-        with sync_playwright() as playwright:
-            print("[PROCESS] Playwright started, launching browser...")
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=["--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox"]
+        return await waiter
+    except PlaywrightTimeoutError:
+        return None
+
+
+async def _has_visible_text(page: Page, pattern: "re.Pattern") -> bool:
+    """Check if visible text matching pattern is on the page."""
+    try:
+        return await page.get_by_text(pattern).first.is_visible()
+    except PlaywrightError:
+        return False
+
+
+def _is_past_login(url: str) -> bool:
+    """Check if a URL is no longer a login/sign-in page."""
+    url = url.lower()
+    return "/login" not in url and "/signin" not in url
+
+
+async def _close_login_context(context: BrowserContext) -> None:
+    """Close a context opened by _new_login_context."""
+    global _active_contexts
+    try:
+        await context.close()
+    finally:
+        _active_contexts -= 1
+
+
+async def _request_code(email: str, login_url: str, session_dir: str) -> Tuple[bool, str]:
+    """
+    Request login code in a fresh context of the shared browser.
+    """
+    logger.debug("Requesting login code for %s", email)
+
+    try:
+        context = await _new_login_context()
+        try:
+            page = await context.new_page()
+
+            # Navigate to login page
+            logger.debug("Navigating to %s", login_url)
+            await page.goto(login_url, wait_until="domcontentloaded", timeout=30000)
+            await _wait_for(page.wait_for_selector(_EMAIL_INPUT_SELECTOR, state="visible", timeout=10000))
+
+            # Find and fill email input
+            email_input = await page.query_selector(_EMAIL_INPUT_SELECTOR)
+            if not email_input:
+                email_input = await page.query_selector('input[type="text"]')
+
+            if not email_input:
+                return False, "Could not find email input field on login page"
+
+            # Clear and fill email
+            logger.debug("Filling email: %s", email)
+            await email_input.fill("")
+            await email_input.fill(email)
+
+            # Find and click submit button
+            submit_button = await page.query_selector('button[type="submit"], input[type="submit"], button:has-text("Continue"), button:has-text("Send"), button:has-text("Login"), button:has-text("Sign in")')
+
+            if not submit_button:
+                return False, "Could not find submit button on login page"
+
+            # Click submit
+            logger.debug("Clicking submit button")
+            await submit_button.click()
+
+            # Wait for the code verification page instead of a fixed delay
+            code_input = await _wait_for(
+                page.wait_for_selector(_CODE_INPUT_SELECTOR, state="visible", timeout=15000)
             )
-            try:
-                context = browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                )
-                page = context.new_page()
-
-                # Navigate to login page
-                print(f"[PROCESS] Navigating to {login_url}...")
-                page.goto(login_url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(2000)
-
-                # Find and fill email input
-                email_input = page.query_selector('input[type="email"], input[name="email"], input[placeholder*="email" i]')
-                if not email_input:
-                    email_input = page.query_selector('input[type="text"]')
-
-                if not email_input:
-                    return False, "Could not find email input field on login page"
-
-                # Clear and fill email
-                print(f"[PROCESS] Filling email: {email}")
-                email_input.fill("")
-                email_input.fill(email)
-                page.wait_for_timeout(500)
-
-                # Find and click submit button
-                submit_button = page.query_selector('button[type="submit"], input[type="submit"], button:has-text("Continue"), button:has-text("Send"), button:has-text("Login"), button:has-text("Sign in")')
-
-                if not submit_button:
-                    return False, "Could not find submit button on login page"
-
-                # Click submit
-                print("[PROCESS] Clicking submit button...")
-                submit_button.click()
-                page.wait_for_timeout(3000)
-
-                # Check if we're now on code verification page
-                code_input = page.query_selector('input[name="code"], input[type="text"][maxlength="6"], input[placeholder*="code" i], input[placeholder*="verification" i]')
-
-                page_text = page.content()
-                is_code_page = (
-                    code_input is not None or
-                    "verification" in page_text.lower() or
-                    "code" in page_text.lower() or
-                    "check your email" in page_text.lower()
+
+            # Otherwise look for a visible hint rather than serializing the page
+            is_code_page = code_input is not None or await _has_visible_text(page, _CODE_PAGE_HINT)
+
+            if is_code_page:
+                # Save login state, with what verification needs to land
+                # straight on the code form
+                write_json_file(
+                    Path(session_dir) / _PENDING_STORAGE_FILE, await context.storage_state()
                 )
+                state = _login_state(email, "code_requested")
+                state["code_page_url"] = page.url
+                write_json_file(Path(session_dir) / "login_state.json", state)
 
-                if is_code_page:
-                    # Save login state
-                    state_file = Path(session_dir) / "login_state.json"
-                    state = {
-                        "email": email,
-                        "status": "code_requested",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    with open(state_file, "w") as f:
-                        json.dump(state, f)
-
-                    print(f"[PROCESS] Login code requested successfully for {email}")
-                    return True, f"Verification code has been sent to {email}. Please check your email."
-                else:
-                    # Check for error messages
-                    error_elem = page.query_selector('.error, .alert-error, [role="alert"], .text-red-500, .text-danger')
-                    if error_elem:
-                        error_text = error_elem.text_content()
-                        return False, f"Login error: {error_text}"
-
-                    return False, "Could not verify if login code was sent. Please check login page."
-            finally:
-                browser.close()
+                logger.debug("Login code requested successfully for %s", email)
+                return True, f"Verification code has been sent to {email}. Please check your email."
+            else:
+                # Check for error messages
+                error_elem = await page.query_selector('.error, .alert-error, [role="alert"], .text-red-500, .text-danger')
+                if error_elem:
+                    error_text = await error_elem.text_content()
+                    return False, f"Login error: {error_text}"
+
+                return False, "Could not verify if login code was sent. Please check login page."
+        finally:
+            await _close_login_context(context)
 
     except Exception as e:
-        import traceback
-        error_detail = traceback.format_exc()
-        print(f"[PROCESS] Error: {e}\n{error_detail}")
+        logger.exception("Error requesting login code")
         return False, f"Error requesting login code: {type(e).__name__}: {str(e)}"
 
 
-def _run_playwright_verify_code(code: str, email: str, login_url: str, session_dir: str) -> Tuple[bool, str]:
+async def _verify_code(code: str, email: str, login_url: str, session_dir: str) -> Tuple[bool, str]:
     """
-    Run Playwright in separate process to verify login code.
-    This function runs in a separate process to avoid Windows asyncio issues.
+    Verify login code in a fresh context of the shared browser.
     """
-    from playwright.sync_api import sync_playwright
-    import json
-    from datetime import datetime, timedelta
-    from pathlib import Path
+    logger.debug("Verifying code for %s", email)
 
-    print(f"[PROCESS] Starting Playwright to verify code for {email}...")
+    # Resume the browser state left by request-code when it is available
+    session_path = Path(session_dir)
+    pending_storage = session_path / _PENDING_STORAGE_FILE
+    code_page_url = None
+    try:
+        state = read_json_file(session_path / "login_state.json")
+        if state.get("email") == email and pending_storage.exists():
+            code_page_url = state.get("code_page_url")
+    except (OSError, ValueError):
+        pass
 
     try:
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=["--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox"]
-            )
-            try:
-                context = browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        context = await _new_login_context(str(pending_storage) if code_page_url else None)
+        try:
+            page = await context.new_page()
+
+            # Go straight to the code form; fall back to entering the email
+            # again when the site shows the login form instead
+            target_url = code_page_url or login_url
+            logger.debug("Navigating to %s", target_url)
+            await page.goto(target_url, wait_until="domcontentloaded", timeout=30000)
+            await _wait_for(page.wait_for_selector(
+                f"{_CODE_INPUT_SELECTOR}, {_EMAIL_INPUT_SELECTOR}", state="visible", timeout=10000
+            ))
+
+            email_input = None
+            if not await page.query_selector(_CODE_INPUT_SELECTOR):
+                email_input = await page.query_selector(_EMAIL_INPUT_SELECTOR)
+            if email_input:
+                logger.debug("Filling email: %s", email)
+                await email_input.fill(email)
+                submit_button = await page.query_selector('button[type="submit"], input[type="submit"], button:has-text("Continue"), button:has-text("Send")')
+                if submit_button:
+                    logger.debug("Clicking submit to get code page")
+                    await submit_button.click()
+                    await _wait_for(
+                        page.wait_for_selector(_CODE_INPUT_SELECTOR, state="visible", timeout=15000)
+                    )
+
+            logger.debug("Current URL: %s", page.url)
+
+            # Try selectors for code input, one query per tier
+            code_input = None
+            for tier in _CODE_SELECTOR_TIERS:
+                code_input = await page.query_selector(tier)
+                if code_input:
+                    break
+
+            # If still not found, take the first visible input that is not an
+            # email/button field, describing every input in one evaluate_all call
+            if not code_input:
+                visible_inputs = page.locator("input:visible")
+                candidates = await visible_inputs.evaluate_all(_DESCRIBE_INPUTS_JS)
+                logger.debug("Found %d visible inputs", len(candidates))
+                for index, candidate in enumerate(candidates):
+                    logger.debug(
+                        "Input: type=%s, name=%s, placeholder=%s",
+                        candidate["type"], candidate["name"], candidate["placeholder"],
+                    )
+                    if candidate["type"] not in ['email', 'hidden', 'submit', 'button'] and candidate["name"] != 'email':
+                        code_input = await visible_inputs.nth(index).element_handle()
+                        logger.debug("Using input: %s", candidate["name"] or candidate["type"])
+                        break
+
+            if not code_input:
+                if not settings.debug_screenshots:
+                    return False, f"Could not find code input field. URL: {page.url}"
+
+                # Save a viewport JPEG of the form area for debugging
+                screenshot_path = Path(session_dir) / "debug_verify_page.jpg"
+                await page.screenshot(
+                    path=str(screenshot_path), type="jpeg", quality=60,
+                    clip={"x": 0, "y": 0, "width": 800, "height": 600},
                 )
-                page = context.new_page()
-
-                # Navigate to login page and enter email first
-                print(f"[PROCESS] Navigating to {login_url}...")
-                page.goto(login_url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(2000)
-
-                email_input = page.query_selector('input[type="email"], input[name="email"], input[placeholder*="email" i]')
-                if email_input:
-                    print(f"[PROCESS] Filling email: {email}")
-                    email_input.fill(email)
-                    submit_button = page.query_selector('button[type="submit"], input[type="submit"], button:has-text("Continue"), button:has-text("Send")')
-                    if submit_button:
-                        print("[PROCESS] Clicking submit to get code page...")
-                        submit_button.click()
-                        page.wait_for_timeout(4000)
-
-                # Debug: print current URL and page content snippet
-                print(f"[PROCESS] Current URL: {page.url}")
-
-                # Try multiple selectors for code input
-                code_selectors = [
-                    'input[name="code"]',
-                    'input[name="token"]',
-                    'input[name="otp"]',
-                    'input[name="verification"]',
-                    'input[type="text"][maxlength="6"]',
-                    'input[type="text"][maxlength="4"]',
-                    'input[type="number"][maxlength="6"]',
-                    'input[type="number"]',
-                    'input[placeholder*="code" i]',
-                    'input[placeholder*="verification" i]',
-                    'input[placeholder*="otp" i]',
-                    'input[placeholder*="token" i]',
-                    'input[autocomplete="one-time-code"]',
-                    # Generic fallbacks
-                    'input[type="text"]:not([name="email"]):not([type="email"])',
-                    'input[type="tel"]',
-                ]
+                logger.debug("Screenshot saved to %s", screenshot_path)
+                return False, f"Could not find code input field. Screenshot saved for debugging. URL: {page.url}"
 
-                code_input = None
-                for selector in code_selectors:
-                    code_input = page.query_selector(selector)
-                    if code_input:
-                        print(f"[PROCESS] Found code input with selector: {selector}")
-                        break
+            # Fill code
+            logger.debug("Filling verification code")
+            await code_input.fill("")
+            await code_input.fill(code)
 
-                # If still not found, try to find any visible input
-                if not code_input:
-                    all_inputs = page.query_selector_all('input:visible')
-                    print(f"[PROCESS] Found {len(all_inputs)} visible inputs")
-                    for inp in all_inputs:
-                        inp_type = inp.get_attribute('type') or 'text'
-                        inp_name = inp.get_attribute('name') or ''
-                        inp_placeholder = inp.get_attribute('placeholder') or ''
-                        print(f"[PROCESS] Input: type={inp_type}, name={inp_name}, placeholder={inp_placeholder}")
-                        if inp_type not in ['email', 'hidden', 'submit', 'button'] and inp_name != 'email':
-                            code_input = inp
-                            print(f"[PROCESS] Using input: {inp_name or inp_placeholder}")
-                            break
-
-                if not code_input:
-                    # Save screenshot for debugging
-                    screenshot_path = Path(session_dir) / "debug_verify_page.png"
-                    page.screenshot(path=str(screenshot_path))
-                    print(f"[PROCESS] Screenshot saved to {screenshot_path}")
-                    return False, f"Could not find code input field. Screenshot saved for debugging. URL: {page.url}"
-
-                # Fill code
-                print(f"[PROCESS] Filling verification code...")
-                code_input.fill("")
-                code_input.fill(code)
-                page.wait_for_timeout(500)
-
-                # Find and click verify/submit button
-                verify_button_selectors = [
-                    'button[type="submit"]',
-                    'input[type="submit"]',
-                    'button:has-text("Verify")',
-                    'button:has-text("Submit")',
-                    'button:has-text("Login")',
-                    'button:has-text("Sign in")',
-                    'button:has-text("Continue")',
-                    # Generic fallback
-                    'button',
-                ]
-                verify_button = None
-                for selector in verify_button_selectors:
-                    verify_button = page.query_selector(selector)
-                    if verify_button:
-                        print(f"[PROCESS] Found verify button with selector: {selector}")
-                        break
+            # Find and click verify/submit button
+            verify_button = None
+            for tier in _VERIFY_BUTTON_TIERS:
+                verify_button = await page.query_selector(tier)
+                if verify_button:
+                    break
 
-                if not verify_button:
-                    return False, "Could not find verify button"
-
-                # Click verify
-                verify_button.click()
-                page.wait_for_timeout(10000) # Increased delay to 10 seconds
-
-                # Check if login was successful
-                current_url = page.url
-
-                def check_login_status():
-                    indicators = [
-                        'button:has-text("Logout")',
-                        'button:has-text("Sign out")',
-                        'a:has-text("Logout")',
-                        'a:has-text("Sign out")',
-                        '[data-testid="user-menu"]',
-                        '.user-avatar',
-                        '.user-profile',
-                        'a[href*="dashboard"]',
-                        'a[href*="account"]',
-                    ]
-                    for selector in indicators:
-                        if page.query_selector(selector):
-                            return True
-                    if "/login" not in current_url.lower() and "/signin" not in current_url.lower():
-                        if not page.query_selector('input[type="email"], form[action*="login"]'):
-                            return True
-                    return False
-
-                def save_session():
-                    storage_state = context.storage_state()
-                    session_path = Path(session_dir)
-                    session_path.mkdir(exist_ok=True)
-
-                    # Save storage state
-                    with open(session_path / "storage_state.json", "w") as f:
-                        json.dump(storage_state, f, indent=2)
-
-                    # Save session data
-                    session_data = {
-                        "email": email,
-                        "cookies": storage_state.get("cookies", []),
-                        "storage_state": storage_state,
-                        "saved_at": datetime.now().isoformat(),
-                        "expires_at": (datetime.now() + timedelta(days=7)).isoformat(),
-                    }
-                    with open(session_path / "session_data.json", "w") as f:
-                        json.dump(session_data, f, indent=2)
+            if not verify_button:
+                return False, "Could not find verify button"
 
-                    # Clear login state
-                    login_state_file = session_path / "login_state.json"
-                    if login_state_file.exists():
-                        login_state_file.unlink()
+            # Click verify
+            await verify_button.click()
+            await _wait_for(page.wait_for_url(_is_past_login, timeout=15000))
 
-                # Check if we're redirected away from login page
+            # Check if login was successful
+            current_url = page.url
+
+            async def check_login_status():
+                if await page.query_selector(_LOGGED_IN_SELECTOR):
+                    return True
                 if "/login" not in current_url.lower() and "/signin" not in current_url.lower():
-                    save_session()
-                    return True, f"Login successful for {email}"
+                    if not await page.query_selector('input[type="email"], form[action*="login"]'):
+                        return True
+                return False
 
-                # Double check login status
-                if check_login_status():
-                    save_session()
-                    return True, f"Login successful for {email}"
+            async def save_session():
+                storage_state = await context.storage_state()
+                session_path.mkdir(exist_ok=True)
 
-                # Check for error messages
-                error_elem = page.query_selector('.error, .alert-error, [role="alert"], .text-red-500, .text-danger')
-                if error_elem:
-                    error_text = error_elem.text_content()
-                    return False, f"Verification failed: {error_text}"
+                # Save storage state
+                write_json_file(session_path / "storage_state.json", storage_state)
+
+                # Save session data; the full storage state lives in storage_state.json
+                session_data = _session_data(email, storage_state)
+                write_json_file(session_path / "session_data.json", session_data)
 
-                return False, "Could not verify login. Please try again."
-            finally:
-                browser.close()
+                # Clear login state
+                for name in ("login_state.json", _PENDING_STORAGE_FILE):
+                    (session_path / name).unlink(missing_ok=True)
+
+            # Check if we're redirected away from login page
+            if "/login" not in current_url.lower() and "/signin" not in current_url.lower():
+                await save_session()
+                return True, f"Login successful for {email}"
+
+            # Double check login status
+            if await check_login_status():
+                await save_session()
+                return True, f"Login successful for {email}"
+
+            # Check for error messages
+            error_elem = await page.query_selector('.error, .alert-error, [role="alert"], .text-red-500, .text-danger')
+            if error_elem:
+                error_text = await error_elem.text_content()
+                return False, f"Verification failed: {error_text}"
+
+            return False, "Could not verify login. Please try again."
+        finally:
+            await _close_login_context(context)
 
     except Exception as e:
-        import traceback
-        error_detail = traceback.format_exc()
-        print(f"[PROCESS] Error: {e}\n{error_detail}")
+        logger.exception("Error verifying login code")
         return False, f"Error verifying login code: {type(e).__name__}: {str(e)}"
 
 
@@ -336,27 +515,25 @@ class AuthService:
         self._pending_email: Optional[str] = None
         self._browser_manager = None
         self._page: Optional[Page] = None
+        # (mtime_ns, size) of session_file and its parsed contents
+        self._session_cache: Optional[Tuple[Tuple[int, int], dict]] = None
 
     def _save_login_state(self, email: str, status: str) -> None:
         """Save login state to file for persistence."""
-        state = {
-            "email": email,
-            "status": status,
-            "timestamp": datetime.now().isoformat()
-        }
-        with open(self.login_state_file, "w") as f:
-            json.dump(state, f)
+        state = _login_state(email, status)
+        write_json_file(self.login_state_file, state)
 
     def _load_login_state(self) -> Optional[dict]:
         """Load login state from file."""
         if not self.login_state_file.exists():
             return None
         try:
-            with open(self.login_state_file, "r") as f:
-                state = json.load(f)
+            state = read_json_file(self.login_state_file)
             # Check if state is still fresh (within 10 minutes)
-            timestamp = datetime.fromisoformat(state["timestamp"])
-            if datetime.now() - timestamp > timedelta(minutes=10):
+            timestamp_ts = state.get("timestamp_ts")
+            if timestamp_ts is None:
+                timestamp_ts = datetime.fromisoformat(state["timestamp"]).timestamp()
+            if time.time() - timestamp_ts > LOGIN_STATE_TTL_SECONDS:
                 self._clear_login_state()
                 return None
             return state
@@ -367,6 +544,7 @@ class AuthService:
         """Clear login state file."""
         if self.login_state_file.exists():
             self.login_state_file.unlink()
+        (self.session_dir / _PENDING_STORAGE_FILE).unlink(missing_ok=True)
         self._pending_email = None
 
     async def request_login_code(self, email: str) -> Tuple[bool, str]:
@@ -380,21 +558,7 @@ class AuthService:
             Tuple of (success, message)
         """
         self.logger.info(f"Requesting login code for {email}...")
-        print(f"[DEBUG] request_login_code called for {email}")
-
-        loop = asyncio.get_running_loop()
-        executor = _get_executor()
-
-        result = await loop.run_in_executor(
-            executor,
-            _run_playwright_request_code,
-            email,
-            self.LOGIN_URL,
-            str(self.session_dir)
-        )
-
-        print(f"[DEBUG] Result: {result}")
-        return result
+        return await _request_code(email, self.LOGIN_URL, str(self.session_dir))
 
     async def verify_login_code(self, code: str, email: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -419,17 +583,7 @@ class AuthService:
 
         self.logger.info(f"Verifying login code for {target_email}...")
 
-        loop = asyncio.get_running_loop()
-        executor = _get_executor()
-
-        result = await loop.run_in_executor(
-            executor,
-            _run_playwright_verify_code,
-            code,
-            target_email,
-            self.LOGIN_URL,
-            str(self.session_dir)
-        )
+        result = await _verify_code(code, target_email, self.LOGIN_URL, str(self.session_dir))
 
         return result
 
@@ -499,34 +653,18 @@ class AuthService:
     async def _check_login_status(self, page: Page) -> bool:
         """Check if user is logged in."""
         try:
-            # Check for common logged-in indicators
             # Look for logout button, user menu, dashboard, etc.
-            indicators = [
-                'button:has-text("Logout")',
-                'button:has-text("Sign out")',
-                'a:has-text("Logout")',
-                'a:has-text("Sign out")',
-                '[data-testid="user-menu"]',
-                '.user-avatar',
-                '.user-profile',
-                'a[href*="dashboard"]',
-                'a[href*="account"]',
-            ]
-
-            for selector in indicators:
-                element = await page.query_selector(selector)
-                if element:
-                    return True
-
-            # Check if we're NOT on login page anymore
-            current_url = page.url
-            if "/login" not in current_url.lower() and "/signin" not in current_url.lower():
-                # Additional check - see if there's no login form
-                login_form = await page.query_selector('input[type="email"], form[action*="login"]')
-                if not login_form:
-                    return True
-
-            return False
+            current_url = page.url.lower()
+            if "/login" in current_url or "/signin" in current_url:
+                return await page.query_selector(_LOGGED_IN_SELECTOR) is not None
+
+            # Off the login page, the absence of a login form also counts;
+            # run both queries at once
+            indicator, login_form = await asyncio.gather(
+                page.query_selector(_LOGGED_IN_SELECTOR),
+                page.query_selector('input[type="email"], form[action*="login"]'),
+            )
+            return indicator is not None or login_form is None
 
         except Exception as e:
             self.logger.warning(f"Error checking login status: {e}")
@@ -535,22 +673,12 @@ class AuthService:
     async def save_session(self, context: BrowserContext, email: str) -> bool:
         """Save browser session/cookies for later use."""
         try:
-            # Get cookies
-            cookies = await context.cookies()
-
-            # Get storage state
+            # Storage state includes the cookies, so one call covers both
             storage_state = await context.storage_state()
 
-            session_data = {
-                "email": email,
-                "cookies": cookies,
-                "storage_state": storage_state,
-                "saved_at": datetime.now().isoformat(),
-                "expires_at": (datetime.now() + timedelta(days=7)).isoformat(),
-            }
+            write_json_file(self.session_dir / "storage_state.json", storage_state)
 
-            with open(self.session_file, "w") as f:
-                json.dump(session_data, f, indent=2)
+            write_json_file(self.session_file, _session_data(email, storage_state))
 
             self.logger.info(f"Session saved for {email}")
             return True
@@ -571,12 +699,10 @@ class AuthService:
             return None
 
         try:
-            with open(self.session_file, "r") as f:
-                session_data = json.load(f)
+            session_data = read_json_file(self.session_file)
 
             # Check if session expired
-            expires_at = datetime.fromisoformat(session_data["expires_at"])
-            if datetime.now() > expires_at:
+            if _session_expired(session_data):
                 self.logger.info("Session expired")
                 self.clear_session()
                 return None
@@ -613,20 +739,9 @@ class AuthService:
             True if saved successfully
         """
         try:
-            import base64
-
             # Extract email from token if not provided
             if not email:
-                try:
-                    # JWT format: header.payload.signature
-                    payload = access_token.split('.')[1]
-                    # Add padding if needed
-                    payload += '=' * (4 - len(payload) % 4)
-                    decoded = base64.b64decode(payload)
-                    token_data = json.loads(decoded)
-                    email = token_data.get('email', 'unknown@email.com')
-                except Exception:
-                    email = 'unknown@email.com'
+                email = _extract_jwt_email(access_token)
 
             # Create token data structure (matching localStorage format)
             token_data = {
@@ -646,7 +761,7 @@ class AuthService:
                         "localStorage": [
                             {
                                 "name": "sge-auth-token",
-                                "value": json.dumps(token_data)
+                                "value": json_dumps(token_data).decode("utf-8")
                             }
                         ]
                     }
@@ -656,8 +771,7 @@ class AuthService:
             # Save storage state file
             self.session_dir.mkdir(exist_ok=True)
             storage_file = self.session_dir / "storage_state.json"
-            with open(storage_file, "w") as f:
-                json.dump(storage_state, f, indent=2)
+            write_json_file(storage_file, storage_state)
 
             # Save session data
             session_data = {
@@ -671,16 +785,13 @@ class AuthService:
                 "expires_at_iso": datetime.fromtimestamp(expires_at).isoformat(),
             }
 
-            with open(self.session_file, "w") as f:
-                json.dump(session_data, f, indent=2)
+            write_json_file(self.session_file, session_data)
 
             self.logger.info(f"Token session saved for {email}, expires at {datetime.fromtimestamp(expires_at)}")
             return True
 
-        except Exception as e:
-            self.logger.error(f"Failed to save token session: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            self.logger.exception("Failed to save token session")
             return False
 
     def save_manual_session(self, email: str, cookies: list) -> bool:
@@ -725,20 +836,15 @@ class AuthService:
             # Save storage state file
             self.session_dir.mkdir(exist_ok=True)
             storage_file = self.session_dir / "storage_state.json"
-            with open(storage_file, "w") as f:
-                json.dump(storage_state, f, indent=2)
+            write_json_file(storage_file, storage_state)
 
             # Save session data
             session_data = {
-                "email": email,
-                "cookies": processed_cookies,
+                **_session_data(email, storage_state),
                 "storage_state": storage_state,
-                "saved_at": datetime.now().isoformat(),
-                "expires_at": (datetime.now() + timedelta(days=7)).isoformat(),
             }
 
-            with open(self.session_file, "w") as f:
-                json.dump(session_data, f, indent=2)
+            write_json_file(self.session_file, session_data)
 
             self.logger.info(f"Manual session saved for {email} with {len(processed_cookies)} cookies")
             return True
@@ -749,35 +855,31 @@ class AuthService:
 
     def clear_session(self) -> None:
         """Clear saved session."""
+        self._session_cache = None
         if self.session_file.exists():
             self.session_file.unlink()
             self.logger.info("Session cleared")
 
     def has_valid_session(self) -> Tuple[bool, Optional[str]]:
         """Check if there's a valid saved session."""
-        if not self.session_file.exists():
+        try:
+            stat = self.session_file.stat()
+        except OSError:
             return False, None
 
         try:
-            with open(self.session_file, "r") as f:
-                session_data = json.load(f)
-
-            # Check for token-based session
-            if session_data.get("auth_type") == "token":
-                expires_at = session_data.get("expires_at")
-                if expires_at and datetime.now().timestamp() > expires_at:
-                    return False, None
-                return True, session_data.get("email")
-
-            # Check for cookie-based session (old format)
-            expires_at_str = session_data.get("expires_at")
-            if expires_at_str:
-                try:
-                    expires_at = datetime.fromisoformat(expires_at_str)
-                    if datetime.now() > expires_at:
-                        return False, None
-                except (ValueError, TypeError):
-                    pass
+            # Reparse only when the file was rewritten; expiry is still
+            # checked on every call
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._session_cache is not None and self._session_cache[0] == key:
+                session_data = self._session_cache[1]
+            else:
+                session_data = read_json_file(self.session_file)
+                self._session_cache = (key, session_data)
+
+            # Token sessions and cookie sessions (old and new format)
+            if _session_expired(session_data):
+                return False, None
 
             return True, session_data.get("email")
 
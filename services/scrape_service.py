@@ -1,38 +1,109 @@
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
+import sys
 from datetime import datetime, date
-from typing import Optional, Set, Callable, Awaitable, List, Dict, Any
+from typing import Optional, Set, Callable, Awaitable, List, Dict, Any, Mapping, Tuple
+from sqlalchemy import delete, insert, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from config.settings import settings
 from config.logging_config import get_logger
-from database.models import Article, SocialContent, ScrapeSession
+from database.models import Article, SocialContent, ScrapeSession, utcnow
 from database.connection import get_session
 from scraper.browser import BrowserManager
 from scraper.sitemap_parser import SitemapParser
-from scraper.article_scraper import ArticleScraper, ArticleData
-from scraper.sync_scraper import scrape_article_sync, scrape_articles_batch_sync
+from scraper.article_scraper import ArticleScraper
+from scraper.sync_scraper import close_executor_browsers, create_scrape_executor, scrape_article_sync
+from scraper.async_scraper import scrape_article_async
+from utils.helpers import AsyncRateLimiter
 from .session_service import SessionService
 from .auth_service import AuthService
 
-# Process pool for sync scraping
+# Scraped articles are upserted in batches of this size
+SAVE_BATCH_SIZE = 50
+
+# Executor for sync scraping: threads, as the work is I/O-bound and each
+# thread keeps its own Playwright browser; a process pool on Windows (see
+# create_scrape_executor)
 _scrape_executor = None
 
 def _get_scrape_executor():
     global _scrape_executor
     if _scrape_executor is None:
-        _scrape_executor = ProcessPoolExecutor(max_workers=1)
+        _scrape_executor = create_scrape_executor(settings.scrape_workers, "scrape")
     return _scrape_executor
 
 
+def close_scrape_browsers() -> None:
+    """Close the browsers the sync scrape threads launched, once a run is over."""
+    if _scrape_executor is not None:
+        close_executor_browsers(_scrape_executor, settings.scrape_workers)
+
+
+# Article columns filled from a scraped article dict, and those that are
+# NOT NULL and default to "" when the scraper did not find them
+_ARTICLE_COLUMNS = (
+    "sge_id", "url", "slug", "title", "subtitle", "content", "content_text",
+    "category", "tags", "author_name", "author_email", "featured_image_url",
+    "read_time", "published_at", "raw_json",
+)
+_REQUIRED_ARTICLE_COLUMNS = ("sge_id", "url", "slug", "title")
+
+# SocialContent columns filled from a scraped social content dict
+_SOCIAL_CONTENT_COLUMNS = (
+    "article_id", "platform", "content_type", "url", "embed_html",
+    "thumbnail_url", "username", "caption", "position_in_article",
+    "extra_data", "screenshot_path", "screenshot_source",
+)
+
+
+def _parse_published_at(value) -> Optional[datetime]:
+    """Parse an ISO published_at from the scraper, passing datetimes through."""
+    if not value or isinstance(value, datetime):
+        return value or None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
 class ScrapeService:
     """Main orchestrator for the scraping process."""
 
+    __slots__ = (
+        "logger", "sitemap_parser", "article_scraper", "auth_service",
+        "_storage_state_file",
+    )
+
     def __init__(self):
         self.logger = get_logger()
         self.sitemap_parser = SitemapParser()
         self.article_scraper = ArticleScraper()
         self.auth_service = AuthService()
+        self._storage_state_file = settings.project_root / "session" / "storage_state.json"
+
+    async def _scrape_article(self, loop, executor, url: str, session_dir: str) -> Optional[dict]:
+        """Scrape one article with the async scraper if enabled, else on the scrape executor."""
+        if settings.scrape_async and sys.platform != "win32":
+            return await scrape_article_async(
+                url, session_dir, settings.base_url, 0, settings.store_raw_json
+            )
+        # Run sync scraper on the scrape executor
+        return await loop.run_in_executor(
+            executor,
+            scrape_article_sync,
+            url,
+            session_dir,
+            settings.base_url,
+            0,
+            settings.store_raw_json
+        )
+
+    def _scrape_concurrency(self) -> int:
+        """Number of articles scraped at once by run_scrape."""
+        if settings.scrape_async and sys.platform != "win32":
+            return max(1, settings.async_concurrency)
+        return max(1, settings.scrape_workers)
 
     async def login(
         self,
@@ -90,8 +161,7 @@ class ScrapeService:
         has_session, email = self.auth_service.has_valid_session()
 
         # Also check storage state file
-        session_file = settings.project_root / "session" / "storage_state.json"
-        has_storage = session_file.exists()
+        has_storage = has_session and self._storage_state_file.exists()
 
         return {
             "has_session": has_session and has_storage,
@@ -104,9 +174,8 @@ class ScrapeService:
         self.auth_service.clear_session()
 
         # Also clear storage state
-        session_file = settings.project_root / "session" / "storage_state.json"
-        if session_file.exists():
-            session_file.unlink()
+        if self._storage_state_file.exists():
+            self._storage_state_file.unlink()
 
         return {
             "status": "success",
@@ -117,7 +186,8 @@ class ScrapeService:
         self,
         limit: Optional[int] = None,
         target_date: Optional[date] = None,
-        force: bool = False
+        force: bool = False,
+        preloaded_urls: Optional[List[str]] = None
     ) -> dict:
         """
         Run a complete scrape session for a specific date.
@@ -126,6 +196,8 @@ class ScrapeService:
             limit: Optional limit on number of articles to scrape.
             target_date: The date to scrape articles for (default: today).
             force: Force scrape even if already has successful scrape for the date.
+            preloaded_urls: Sitemap URLs for target_date already fetched by the
+                caller; the sitemap is not fetched again when given.
 
         Returns:
             Dict with scrape statistics.
@@ -137,24 +209,27 @@ class ScrapeService:
             session_service = SessionService(db)
 
             # Check if already has successful scrape for this date
-            if not force and session_service.has_successful_scrape_for_date(target_date):
+            existing_session = None if force else session_service.get_session_for_date(target_date)
+            if existing_session is not None:
                 self.logger.info(
                     f"Already has successful scrape for {target_date}. "
                     "Use force=True to scrape again."
                 )
-                existing_session = session_service.get_session_for_date(target_date)
                 return {
                     "status": "skipped",
                     "message": f"Already has successful scrape for {target_date}",
-                    "session_id": existing_session.id if existing_session else None,
-                    "articles_success": existing_session.articles_success if existing_session else 0,
+                    "session_id": existing_session.id,
+                    "articles_success": existing_session.articles_success,
                 }
 
             scrape_session = session_service.create_session(target_date=target_date)
 
             try:
                 # Get article URLs for the specific target date
-                article_urls = await self.sitemap_parser.get_article_urls_for_date(target_date)
+                if preloaded_urls is not None:
+                    article_urls = list(preloaded_urls)
+                else:
+                    article_urls = await self.sitemap_parser.get_article_urls_for_date(target_date)
 
                 # If no date-filtered URLs found from sitemap, try homepage
                 # Homepage shows latest articles which may include target date
@@ -196,10 +271,11 @@ class ScrapeService:
                 )
 
                 # Filter out already scraped articles
-                existing_slugs = self._get_existing_slugs(db)
+                slugs = list(map(self.sitemap_parser.extract_slug_from_url, article_urls))
+                existing_slugs = self._get_existing_slugs(db, slugs)
                 new_urls = [
-                    url for url in article_urls
-                    if self.sitemap_parser.extract_slug_from_url(url) not in existing_slugs
+                    url for url, slug in zip(article_urls, slugs)
+                    if slug not in existing_slugs
                 ]
 
                 self.logger.info(
@@ -229,59 +305,70 @@ class ScrapeService:
                 articles_updated = 0
                 articles_skipped = 0
 
-                # Use sync scraper in separate process (Windows compatibility)
+                # Scrape several articles at once; results are saved on this
+                # thread as they arrive, so the db session is never shared
                 session_dir = str(settings.project_root / "session")
                 loop = asyncio.get_running_loop()
                 executor = _get_scrape_executor()
+                concurrency = self._scrape_concurrency()
+                semaphore = asyncio.Semaphore(concurrency)
+                # Article starts are spaced by DELAY_BETWEEN_ARTICLES_MS across
+                # all workers, after an initial burst of one per worker
+                limiter = AsyncRateLimiter(
+                    settings.delay_between_articles_ms / 1000, burst=concurrency
+                )
 
-                for i, url in enumerate(urls_to_scrape):
-                    self.logger.info(
-                        f"Processing {i + 1}/{len(urls_to_scrape)}: {url}"
-                    )
-                    articles_scraped += 1
-
-                    try:
-                        # Run sync scraper in separate process
-                        article_dict = await loop.run_in_executor(
-                            executor,
-                            scrape_article_sync,
-                            url,
-                            session_dir,
-                            settings.base_url
+                async def scrape_one(i: int, url: str):
+                    async with semaphore, limiter:
+                        self.logger.info(
+                            "Processing %d/%d: %s", i + 1, len(urls_to_scrape), url
                         )
+                        try:
+                            article_dict = await self._scrape_article(
+                                loop, executor, url, session_dir
+                            )
+                        except Exception as e:
+                            self.logger.error(f"FAILED: Error processing {url}: {e}")
+                            article_dict = None
+                    return url, article_dict
+
+                tasks = [
+                    asyncio.create_task(scrape_one(i, url))
+                    for i, url in enumerate(urls_to_scrape)
+                ]
 
-                        if article_dict:
-                            # Convert dict to ArticleData-like object for validation
-                            article_data = self._dict_to_article_data(article_dict)
+                # Validated articles waiting to be saved in one upsert
+                pending: List[Dict[str, Any]] = []
 
-                            # Validate article date matches target date
-                            if not self._is_article_for_date(article_data, target_date):
-                                self.logger.info(
-                                    f"Skipping article - not from target date {target_date}: "
-                                    f"{article_data.title[:50] if article_data.title else url}"
-                                )
-                                articles_skipped += 1
-                                continue
+                for task in asyncio.as_completed(tasks):
+                    url, article_dict = await task
+                    articles_scraped += 1
 
-                            # Save article
-                            is_new = self._save_article_from_dict(db, article_dict)
-                            articles_success += 1
+                    if not article_dict:
+                        articles_failed += 1
+                        self.logger.warning("FAILED: Could not scrape %s", url)
+                        continue
+
+                    try:
+                        # Parse the date once; validation and saving reuse it
+                        article_dict["published_at"] = _parse_published_at(
+                            article_dict.get("published_at")
+                        )
 
-                            if is_new:
-                                articles_new += 1
-                            else:
-                                articles_updated += 1
+                        title = article_dict.get("title")
 
+                        # Validate article date matches target date
+                        if not self._is_article_for_date(article_dict, target_date):
                             self.logger.info(
-                                f"SUCCESS: {article_data.title[:50] if article_data.title else url}"
+                                "Skipping article - not from target date %s: %s",
+                                target_date, title[:50] if title else url
                             )
-                        else:
-                            articles_failed += 1
-                            self.logger.warning(f"FAILED: Could not scrape {url}")
+                            articles_skipped += 1
+                            continue
 
-                        # Delay between articles
-                        await asyncio.sleep(
-                            settings.delay_between_articles_ms / 1000
+                        pending.append(article_dict)
+                        self.logger.info(
+                            "SUCCESS: %s", title[:50] if title else url
                         )
 
                     except Exception as e:
@@ -289,6 +376,21 @@ class ScrapeService:
                         self.logger.error(f"FAILED: Error processing {url}: {e}")
                         continue
 
+                    if len(pending) >= SAVE_BATCH_SIZE:
+                        success, new = self._save_article_batch(db, pending)
+                        articles_success += success
+                        articles_failed += len(pending) - success
+                        articles_new += new
+                        articles_updated += success - new
+                        pending = []
+
+                if pending:
+                    success, new = self._save_article_batch(db, pending)
+                    articles_success += success
+                    articles_failed += len(pending) - success
+                    articles_new += new
+                    articles_updated += success - new
+
                 # Complete session
                 session_service.complete_session(
                     scrape_session,
@@ -324,26 +426,31 @@ class ScrapeService:
                     "error": str(e),
                 }
 
-    def _is_article_for_date(self, article_data: ArticleData, target_date: date) -> bool:
+            finally:
+                # Between runs idle worker threads would keep their Chromium
+                await asyncio.to_thread(close_scrape_browsers)
+
+    def _is_article_for_date(self, article_dict: Mapping[str, Any], target_date: date) -> bool:
         """
         Check if article was published on the target date.
 
         Args:
-            article_data: The scraped article data.
+            article_dict: The scraped article data.
             target_date: The date to match against.
 
         Returns:
             True if article is from target date, False otherwise.
         """
-        if article_data.published_at is None:
+        published_at = _parse_published_at(article_dict.get("published_at"))
+        if published_at is None:
             # If no published date, assume it's invalid
+            title = article_dict.get("title")
             self.logger.warning(
-                f"Article has no published_at date, skipping: {article_data.title[:50] if article_data.title else 'Unknown'}"
+                f"Article has no published_at date, skipping: {title[:50] if title else 'Unknown'}"
             )
             return False
 
-        article_date = article_data.published_at.date()
-        return article_date == target_date
+        return published_at.date() == target_date
 
     async def scrape_single_article(
         self,
@@ -364,27 +471,17 @@ class ScrapeService:
         """
         self.logger.info(f"Scraping single article: {url}")
 
-        # Use sync scraper in separate process (Windows compatibility)
         session_dir = str(settings.project_root / "session")
         loop = asyncio.get_running_loop()
         executor = _get_scrape_executor()
 
-        article_dict = await loop.run_in_executor(
-            executor,
-            scrape_article_sync,
-            url,
-            session_dir,
-            settings.base_url
-        )
+        article_dict = await self._scrape_article(loop, executor, url, session_dir)
 
         if article_dict:
-            # Convert to ArticleData for date validation
-            article_data = self._dict_to_article_data(article_dict)
-
             # Check date if target_date specified
             date_valid = True
             if target_date:
-                date_valid = self._is_article_for_date(article_data, target_date)
+                date_valid = self._is_article_for_date(article_dict, target_date)
 
             result = {
                 "sge_id": article_dict.get("sge_id"),
@@ -439,40 +536,38 @@ class ScrapeService:
         from datetime import timedelta
 
         results = []
+        total_success = 0
+        total_failed = 0
+        dates_completed = 0
+        dates_skipped = 0
         current_date = start_date
 
+        # Fetch the sitemaps once for the whole range
+        urls_by_date = await self.sitemap_parser.get_article_urls_by_date(start_date, end_date)
+
         while current_date <= end_date:
             self.logger.info(f"Processing date: {current_date}")
             result = await self.run_scrape(
                 limit=limit_per_day,
                 target_date=current_date,
-                force=False  # Skip if already done
+                force=False,  # Skip if already done
+                preloaded_urls=urls_by_date.get(current_date, []),
             )
             results.append({
                 "date": str(current_date),
                 "result": result
             })
-            current_date += timedelta(days=1)
 
-        # Summarize results
-        total_success = sum(
-            r["result"].get("articles_success", 0)
-            for r in results
-            if r["result"].get("status") == "completed"
-        )
-        total_failed = sum(
-            r["result"].get("articles_failed", 0)
-            for r in results
-            if r["result"].get("status") == "completed"
-        )
-        dates_completed = sum(
-            1 for r in results
-            if r["result"].get("status") == "completed"
-        )
-        dates_skipped = sum(
-            1 for r in results
-            if r["result"].get("status") == "skipped"
-        )
+            # Summarize results as they come in
+            status = result.get("status")
+            if status == "completed":
+                dates_completed += 1
+                total_success += result.get("articles_success", 0)
+                total_failed += result.get("articles_failed", 0)
+            elif status == "skipped":
+                dates_skipped += 1
+
+            current_date += timedelta(days=1)
 
         return {
             "status": "completed",
@@ -509,34 +604,6 @@ class ScrapeService:
                     "articles_success": 0,
                 }
 
-    def _dict_to_article_data(self, article_dict: Dict[str, Any]) -> ArticleData:
-        """Convert article dict from sync scraper to ArticleData object."""
-        published_at = None
-        if article_dict.get("published_at"):
-            try:
-                published_at = datetime.fromisoformat(article_dict["published_at"])
-            except:
-                pass
-
-        return ArticleData(
-            sge_id=article_dict.get("sge_id", ""),
-            url=article_dict.get("url", ""),
-            slug=article_dict.get("slug", ""),
-            title=article_dict.get("title", ""),
-            subtitle=article_dict.get("subtitle"),
-            content=article_dict.get("content"),
-            content_text=article_dict.get("content_text"),
-            category=article_dict.get("category"),
-            tags=article_dict.get("tags"),
-            author_name=article_dict.get("author_name"),
-            author_email=article_dict.get("author_email"),
-            featured_image_url=article_dict.get("featured_image_url"),
-            read_time=article_dict.get("read_time"),
-            published_at=published_at,
-            raw_json=article_dict.get("raw_json"),
-            social_contents=[],
-        )
-
     def _save_article_from_dict(self, db: Session, article_dict: Dict[str, Any]) -> bool:
         """
         Save or update article from dict in database.
@@ -544,216 +611,149 @@ class ScrapeService:
         Returns:
             True if article is new, False if updated.
         """
-        sge_id = article_dict.get("sge_id", "")
-
-        # Parse published_at
-        published_at = None
-        if article_dict.get("published_at"):
-            try:
-                published_at = datetime.fromisoformat(article_dict["published_at"])
-            except:
-                pass
-
-        # Check if article exists
-        existing = db.query(Article).filter(Article.sge_id == sge_id).first()
-
-        if existing:
-            # Update existing article
-            existing.url = article_dict.get("url", "")
-            existing.slug = article_dict.get("slug", "")
-            existing.title = article_dict.get("title", "")
-            existing.subtitle = article_dict.get("subtitle")
-            existing.content = article_dict.get("content")
-            existing.content_text = article_dict.get("content_text")
-            existing.category = article_dict.get("category")
-            existing.tags = article_dict.get("tags")
-            existing.author_name = article_dict.get("author_name")
-            existing.author_email = article_dict.get("author_email")
-            existing.featured_image_url = article_dict.get("featured_image_url")
-            existing.read_time = article_dict.get("read_time")
-            existing.published_at = published_at
-            existing.raw_json = article_dict.get("raw_json")
-            existing.updated_at = datetime.utcnow()
-
-            # Update social contents
-            self._update_social_contents_from_dict(db, existing.id, article_dict.get("social_contents", []))
-
-            self.logger.debug(f"Updated article: {article_dict.get('title', '')}")
-            return False
-        else:
-            # Create new article
-            article = Article(
-                sge_id=sge_id,
-                url=article_dict.get("url", ""),
-                slug=article_dict.get("slug", ""),
-                title=article_dict.get("title", ""),
-                subtitle=article_dict.get("subtitle"),
-                content=article_dict.get("content"),
-                content_text=article_dict.get("content_text"),
-                category=article_dict.get("category"),
-                tags=article_dict.get("tags"),
-                author_name=article_dict.get("author_name"),
-                author_email=article_dict.get("author_email"),
-                featured_image_url=article_dict.get("featured_image_url"),
-                read_time=article_dict.get("read_time"),
-                published_at=published_at,
-                raw_json=article_dict.get("raw_json"),
-            )
-            db.add(article)
-            db.flush()
+        return self._save_articles_from_dicts(db, [article_dict]) == 1
 
-            # Add social contents
-            self._add_social_contents_from_dict(db, article.id, article_dict.get("social_contents", []))
-
-            self.logger.debug(f"Created new article: {article_dict.get('title', '')}")
-            return True
+    def _save_article_batch(self, db: Session, article_dicts: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Save a batch of articles inside a savepoint.
 
-    def _add_social_contents_from_dict(
-        self,
-        db: Session,
-        article_id: int,
-        social_contents: List[Dict]
-    ) -> None:
-        """Add social content records from dict list."""
-        for sc_data in social_contents:
-            # Build extra_data with stats and additional info
-            extra_data = {}
-            if sc_data.get("stats"):
-                extra_data["stats"] = sc_data["stats"]
-            if sc_data.get("video_id"):
-                extra_data["video_id"] = sc_data["video_id"]
-            if sc_data.get("embed_id"):
-                extra_data["embed_id"] = sc_data["embed_id"]
-
-            social_content = SocialContent(
-                article_id=article_id,
-                platform=sc_data.get("platform", "unknown"),
-                content_type=sc_data.get("content_type", "unknown"),
-                url=sc_data.get("url"),
-                embed_html=sc_data.get("embed_html"),
-                thumbnail_url=sc_data.get("thumbnail_url"),
-                username=sc_data.get("username"),
-                caption=sc_data.get("caption"),
-                position_in_article=sc_data.get("position_in_article", 0),
-                extra_data=extra_data if extra_data else None,
-                screenshot_path=sc_data.get("screenshot_path"),
-                screenshot_source=sc_data.get("screenshot_source"),
-            )
-            db.add(social_content)
+        Returns:
+            Tuple of (saved, new) counts; (0, 0) if the batch was rolled back.
+        """
+        try:
+            with db.begin_nested():
+                new_count = self._save_articles_from_dicts(db, article_dicts)
+        except Exception as e:
+            self.logger.error(f"FAILED: Could not save {len(article_dicts)} articles: {e}")
+            return 0, 0
+        return len(article_dicts), new_count
 
-    def _update_social_contents_from_dict(
-        self,
-        db: Session,
-        article_id: int,
-        social_contents: List[Dict]
-    ) -> None:
-        """Update social contents from dict list."""
-        # Delete existing
-        db.query(SocialContent).filter(SocialContent.article_id == article_id).delete()
-        # Add new
-        self._add_social_contents_from_dict(db, article_id, social_contents)
-
-    def _get_existing_slugs(self, db: Session) -> Set[str]:
-        """Get set of slugs already in the database."""
-        results = db.query(Article.slug).all()
-        return {row[0] for row in results}
-
-    def _save_article(self, db: Session, article_data: ArticleData) -> bool:
+    def _save_articles_from_dicts(self, db: Session, article_dicts: List[Dict[str, Any]]) -> int:
         """
-        Save or update article in database.
+        Upsert a batch of articles and replace their social contents.
+
+        Articles go in as one INSERT ... ON CONFLICT (sge_id) DO UPDATE. The
+        social contents of updated articles are diffed against the stored
+        rows, so only changed rows are deleted (one DELETE) and inserted (one
+        executemany); an unchanged re-scrape writes no social contents.
 
         Returns:
-            True if article is new, False if updated.
+            Number of articles that were new.
         """
-        # Check if article exists
-        existing = db.query(Article).filter(
-            Article.sge_id == article_data.sge_id
-        ).first()
-
-        if existing:
-            # Update existing article
-            existing.url = article_data.url
-            existing.slug = article_data.slug
-            existing.title = article_data.title
-            existing.subtitle = article_data.subtitle
-            existing.content = article_data.content
-            existing.content_text = article_data.content_text
-            existing.category = article_data.category
-            existing.tags = article_data.tags
-            existing.author_name = article_data.author_name
-            existing.author_email = article_data.author_email
-            existing.featured_image_url = article_data.featured_image_url
-            existing.read_time = article_data.read_time
-            existing.published_at = article_data.published_at
-            existing.raw_json = article_data.raw_json
-            existing.updated_at = datetime.utcnow()
-
-            # Update social contents
-            self._update_social_contents(db, existing.id, article_data.social_contents)
-
-            self.logger.debug(f"Updated article: {article_data.title}")
-            return False
-        else:
-            # Create new article
-            article = Article(
-                sge_id=article_data.sge_id,
-                url=article_data.url,
-                slug=article_data.slug,
-                title=article_data.title,
-                subtitle=article_data.subtitle,
-                content=article_data.content,
-                content_text=article_data.content_text,
-                category=article_data.category,
-                tags=article_data.tags,
-                author_name=article_data.author_name,
-                author_email=article_data.author_email,
-                featured_image_url=article_data.featured_image_url,
-                read_time=article_data.read_time,
-                published_at=article_data.published_at,
-                raw_json=article_data.raw_json,
+        # ON CONFLICT cannot touch the same row twice in one statement
+        by_sge_id = {d.get("sge_id", ""): d for d in article_dicts}
+        if not by_sge_id:
+            return 0
+
+        now = utcnow()
+        rows = [
+            {**self._article_row_from_dict(d), "created_at": now, "updated_at": now}
+            for d in by_sge_id.values()
+        ]
+
+        stmt = pg_insert(Article).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Article.sge_id],
+            set_={
+                name: stmt.excluded[name]
+                for name in rows[0]
+                if name not in ("sge_id", "created_at")
+            },
+        ).returning(Article.id, Article.sge_id, literal_column("xmax = 0"))
+
+        article_ids = {}
+        updated_ids = []
+        new_count = 0
+        for article_id, sge_id, inserted in db.execute(stmt):
+            article_ids[sge_id] = article_id
+            if inserted:
+                new_count += 1
+            else:
+                updated_ids.append(article_id)
+
+        # Social contents already stored for updated articles, to diff against
+        existing_socials: Dict[int, List[Dict[str, Any]]] = {}
+        if updated_ids:
+            columns = [SocialContent.__table__.c[name] for name in _SOCIAL_CONTENT_COLUMNS]
+            for row in db.execute(
+                select(SocialContent.id, *columns)
+                .where(SocialContent.article_id.in_(updated_ids))
+            ).mappings():
+                existing_socials.setdefault(row["article_id"], []).append(dict(row))
+
+        # Keep rows that are unchanged, insert new ones, delete the leftovers
+        social_rows = []
+        stale_ids = []
+        for sge_id, article_dict in by_sge_id.items():
+            article_id = article_ids[sge_id]
+            existing = existing_socials.get(article_id, [])
+            for sc_data in article_dict.get("social_contents", []):
+                row = self._social_content_row_from_dict(article_id, sc_data)
+                match = next(
+                    (i for i, old in enumerate(existing)
+                     if all(old[name] == value for name, value in row.items())),
+                    None,
+                )
+                if match is None:
+                    social_rows.append(row)
+                else:
+                    del existing[match]
+            stale_ids.extend(old["id"] for old in existing)
+
+        if stale_ids:
+            db.execute(
+                delete(SocialContent).where(SocialContent.id.in_(stale_ids)),
+                execution_options={"synchronize_session": False},
             )
-            db.add(article)
-            db.flush()
-
-            # Add social contents
-            self._add_social_contents(db, article.id, article_data.social_contents)
+        if social_rows:
+            db.execute(insert(SocialContent), social_rows)
 
-            self.logger.debug(f"Created new article: {article_data.title}")
-            return True
+        self.logger.debug(
+            f"Saved {len(rows)} articles ({new_count} new, {len(updated_ids)} updated)"
+        )
+        return new_count
+
+    def _article_row_from_dict(self, article_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Build an articles row from a scraped article dict."""
+        row = {name: article_dict.get(name) for name in _ARTICLE_COLUMNS}
+        for name in _REQUIRED_ARTICLE_COLUMNS:
+            if row[name] is None:
+                row[name] = ""
+        row["published_at"] = _parse_published_at(row["published_at"])
+        return row
+
+    def _social_content_row_from_dict(self, article_id: int, sc_data: Dict) -> Dict[str, Any]:
+        """Build a social_contents row from a scraped social content dict."""
+        # Build extra_data with stats and additional info
+        extra_data = {}
+        if sc_data.get("stats"):
+            extra_data["stats"] = sc_data["stats"]
+        if sc_data.get("video_id"):
+            extra_data["video_id"] = sc_data["video_id"]
+        if sc_data.get("embed_id"):
+            extra_data["embed_id"] = sc_data["embed_id"]
 
-    def _add_social_contents(
-        self,
-        db: Session,
-        article_id: int,
-        social_contents: list
-    ) -> None:
-        """Add social content records for an article."""
-        for sc_data in social_contents:
-            social_content = SocialContent(
-                article_id=article_id,
-                platform=sc_data.platform,
-                content_type=sc_data.content_type,
-                url=sc_data.url,
-                embed_html=sc_data.embed_html,
-                thumbnail_url=sc_data.thumbnail_url,
-                username=sc_data.username,
-                caption=sc_data.caption,
-                extra_data=sc_data.metadata,
-                position_in_article=sc_data.position_in_article,
-            )
-            db.add(social_content)
+        return {
+            "article_id": article_id,
+            "platform": sc_data.get("platform", "unknown"),
+            "content_type": sc_data.get("content_type", "unknown"),
+            "url": sc_data.get("url"),
+            "embed_html": sc_data.get("embed_html"),
+            "thumbnail_url": sc_data.get("thumbnail_url"),
+            "username": sc_data.get("username"),
+            "caption": sc_data.get("caption"),
+            "position_in_article": sc_data.get("position_in_article", 0),
+            "extra_data": extra_data if extra_data else None,
+            "screenshot_path": sc_data.get("screenshot_path"),
+            "screenshot_source": sc_data.get("screenshot_source"),
+        }
 
-    def _update_social_contents(
-        self,
-        db: Session,
-        article_id: int,
-        social_contents: list
-    ) -> None:
-        """Update social contents for an existing article."""
-        # Delete existing social contents
-        db.query(SocialContent).filter(
-            SocialContent.article_id == article_id
-        ).delete()
-
-        # Add new social contents
-        self._add_social_contents(db, article_id, social_contents)
+    def _get_existing_slugs(self, db: Session, candidate_slugs: List[str]) -> Set[str]:
+        """Get the subset of candidate_slugs already in the database."""
+        if not candidate_slugs:
+            return set()
+        return set(
+            db.execute(
+                select(Article.slug).where(Article.slug.in_(set(candidate_slugs)))
+            ).scalars()
+        )
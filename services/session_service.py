@@ -1,13 +1,21 @@
-from datetime import datetime, date
+from datetime import date
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import exists
+from sqlalchemy.orm import Session, defer, raiseload
 
-from database.models import ScrapeSession
+from database.models import ScrapeSession, utcnow
 from config.logging_config import get_logger
 
 
 class SessionService:
-    """Manage scrape sessions in the database."""
+    """
+    Manage scrape sessions in the database.
+
+    Updates to an existing session are left to the caller's unit of work and
+    written by its next flush or commit; only create_session flushes, to get
+    the new row's id. Read queries raise on relationship lazy loads, so a
+    caller needing one must eager-load it explicitly.
+    """
 
     def __init__(self, db_session: Session):
         self.db = db_session
@@ -16,7 +24,7 @@ class SessionService:
     def create_session(self, target_date: Optional[date] = None) -> ScrapeSession:
         """Create a new scrape session for a specific date."""
         session = ScrapeSession(
-            started_at=datetime.utcnow(),
+            started_at=utcnow(),
             target_date=target_date or date.today(),
             status="running",
             articles_found=0,
@@ -46,26 +54,21 @@ class SessionService:
         error_message: Optional[str] = None,
     ) -> ScrapeSession:
         """Update scrape session statistics."""
-        if status:
-            session.status = status
-        if articles_found is not None:
-            session.articles_found = articles_found
-        if articles_scraped is not None:
-            session.articles_scraped = articles_scraped
-        if articles_success is not None:
-            session.articles_success = articles_success
-        if articles_failed is not None:
-            session.articles_failed = articles_failed
-        if articles_new is not None:
-            session.articles_new = articles_new
-        if articles_updated is not None:
-            session.articles_updated = articles_updated
-        if articles_skipped is not None:
-            session.articles_skipped = articles_skipped
-        if error_message:
-            session.error_message = error_message
+        changed = {
+            "status": status or None,
+            "articles_found": articles_found,
+            "articles_scraped": articles_scraped,
+            "articles_success": articles_success,
+            "articles_failed": articles_failed,
+            "articles_new": articles_new,
+            "articles_updated": articles_updated,
+            "articles_skipped": articles_skipped,
+            "error_message": error_message or None,
+        }
+        for name, value in changed.items():
+            if value is not None:
+                setattr(session, name, value)
 
-        self.db.flush()
         return session
 
     def complete_session(
@@ -81,7 +84,7 @@ class SessionService:
     ) -> ScrapeSession:
         """Mark session as completed."""
         session.status = "completed"
-        session.finished_at = datetime.utcnow()
+        session.finished_at = utcnow()
         session.articles_found = articles_found
         session.articles_scraped = articles_scraped
         session.articles_success = articles_success
@@ -89,7 +92,6 @@ class SessionService:
         session.articles_new = articles_new
         session.articles_updated = articles_updated
         session.articles_skipped = articles_skipped
-        self.db.flush()
 
         self.logger.info(
             f"Session {session.id} for {session.target_date} completed: "
@@ -102,9 +104,8 @@ class SessionService:
     def fail_session(self, session: ScrapeSession, error_message: str) -> ScrapeSession:
         """Mark session as failed."""
         session.status = "failed"
-        session.finished_at = datetime.utcnow()
+        session.finished_at = utcnow()
         session.error_message = error_message
-        self.db.flush()
 
         self.logger.error(f"Session {session.id} failed: {error_message}")
         return session
@@ -113,6 +114,7 @@ class SessionService:
         """Get the most recent scrape session."""
         return (
             self.db.query(ScrapeSession)
+            .options(defer(ScrapeSession.error_message), raiseload("*"))
             .order_by(ScrapeSession.started_at.desc())
             .first()
         )
@@ -121,6 +123,7 @@ class SessionService:
         """Get all currently running sessions."""
         return (
             self.db.query(ScrapeSession)
+            .options(defer(ScrapeSession.error_message), raiseload("*"))
             .filter(ScrapeSession.status == "running")
             .all()
         )
@@ -129,19 +132,26 @@ class SessionService:
         """Get successful session for a specific date."""
         return (
             self.db.query(ScrapeSession)
-            .filter(
-                ScrapeSession.target_date == target_date,
-                ScrapeSession.status == "completed",
-                ScrapeSession.articles_success > 0  # Hanya yang ada artikel sukses
-            )
+            .options(raiseload("*"))
+            .filter(*self._successful_for_date(target_date))
             .order_by(ScrapeSession.started_at.desc())
             .first()
         )
 
     def has_successful_scrape_for_date(self, target_date: date) -> bool:
         """Check if there's already a successful scrape for a specific date."""
-        session = self.get_session_for_date(target_date)
-        return session is not None
+        return self.db.query(
+            exists().where(*self._successful_for_date(target_date))
+        ).scalar()
+
+    @staticmethod
+    def _successful_for_date(target_date: date) -> tuple:
+        """Filter criteria for a completed session with successful articles."""
+        return (
+            ScrapeSession.target_date == target_date,
+            ScrapeSession.status == "completed",
+            ScrapeSession.articles_success > 0,  # Hanya yang ada artikel sukses
+        )
 
     def get_sessions_by_date_range(
         self, start_date: date, end_date: date
@@ -149,6 +159,7 @@ class SessionService:
         """Get all sessions within a date range."""
         return (
             self.db.query(ScrapeSession)
+            .options(raiseload("*"))
             .filter(
                 ScrapeSession.target_date >= start_date,
                 ScrapeSession.target_date <= end_date
@@ -1,11 +1,42 @@
 """TikTok authentication service for screenshot feature."""
-import json
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Tuple
 
 from config.settings import settings
 from config.logging_config import get_logger
+from utils.helpers import read_json_file, write_json_file
+
+
+# Elements only shown to a logged-in user
+_PROFILE_INDICATORS = ", ".join([
+    '[data-e2e="profile-icon"]',
+    'div[data-e2e="nav-avatar"]',
+    'a[href*="/profile"]',
+    'button[aria-label*="Profile"]',
+])
+
+# Logged in once redirected away from the login page with a profile element
+# showing, or when the profile icon shows even on the login page
+_LOGGED_IN_JS = """selector => !!document.querySelector('[data-e2e="profile-icon"]')
+    || (!location.href.toLowerCase().includes('/login') && !!document.querySelector(selector))"""
+
+
+def _save_tiktok_session(context, session_dir: str) -> None:
+    """Save the context's storage state and the session metadata."""
+    session_path = Path(session_dir)
+    session_path.mkdir(exist_ok=True)
+
+    write_json_file(session_path / "tiktok_storage_state.json", context.storage_state())
+
+    # Save session metadata
+    session_data = {
+        "logged_in": True,
+        "saved_at": datetime.now().isoformat(),
+        "expires_at": (datetime.now() + timedelta(days=14)).isoformat(),
+    }
+    write_json_file(session_path / "tiktok_session.json", session_data)
 
 
 def _run_tiktok_manual_login(session_dir: str) -> Tuple[bool, str]:
@@ -13,7 +44,7 @@ def _run_tiktok_manual_login(session_dir: str) -> Tuple[bool, str]:
     Run Playwright for manual TikTok login.
     Opens browser for user to login manually.
     """
-    from playwright.sync_api import sync_playwright
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
 
     print("[TIKTOK] Starting manual login...")
 
@@ -39,69 +70,21 @@ def _run_tiktok_manual_login(session_dir: str) -> Tuple[bool, str]:
                 print("[TIKTOK] After login, the browser will close automatically.")
                 print("[TIKTOK] Waiting for login (max 5 minutes)...")
 
-                # Wait for successful login (check for profile/avatar)
+                # Wait for successful login (check for profile/avatar). The
+                # check runs inside the page, so waiting costs no round-trips
+                # and ends as soon as an indicator shows up
                 max_wait = 300  # 5 minutes
-                check_interval = 2  # Check every 2 seconds
-                waited = 0
-
-                while waited < max_wait:
-                    page.wait_for_timeout(check_interval * 1000)
-                    waited += check_interval
-
-                    # Check if logged in by looking for profile indicators
-                    current_url = page.url
-
-                    # If redirected away from login page
-                    if "/login" not in current_url.lower():
-                        # Check for avatar or profile elements
-                        profile_indicators = [
-                            '[data-e2e="profile-icon"]',
-                            'div[data-e2e="nav-avatar"]',
-                            'a[href*="/profile"]',
-                            'button[aria-label*="Profile"]',
-                        ]
-
-                        for selector in profile_indicators:
-                            if page.query_selector(selector):
-                                print(f"[TIKTOK] Login detected! Saving session...")
-
-                                # Save session
-                                session_path = Path(session_dir)
-                                session_path.mkdir(exist_ok=True)
-
-                                storage_state = context.storage_state()
-                                with open(session_path / "tiktok_storage_state.json", "w") as f:
-                                    json.dump(storage_state, f, indent=2)
-
-                                # Save session metadata
-                                session_data = {
-                                    "logged_in": True,
-                                    "saved_at": datetime.now().isoformat(),
-                                    "expires_at": (datetime.now() + timedelta(days=14)).isoformat(),
-                                }
-                                with open(session_path / "tiktok_session.json", "w") as f:
-                                    json.dump(session_data, f, indent=2)
-
-                                return True, "TikTok login successful! Session saved."
-
-                    # Also check on login page if already logged in
-                    if page.query_selector('[data-e2e="profile-icon"]'):
-                        print("[TIKTOK] Already logged in!")
-                        storage_state = context.storage_state()
-                        session_path = Path(session_dir)
-                        session_path.mkdir(exist_ok=True)
-                        with open(session_path / "tiktok_storage_state.json", "w") as f:
-                            json.dump(storage_state, f, indent=2)
-                        session_data = {
-                            "logged_in": True,
-                            "saved_at": datetime.now().isoformat(),
-                            "expires_at": (datetime.now() + timedelta(days=14)).isoformat(),
-                        }
-                        with open(session_path / "tiktok_session.json", "w") as f:
-                            json.dump(session_data, f, indent=2)
-                        return True, "TikTok login successful! Session saved."
-
-                return False, "Login timeout. Please try again."
+                try:
+                    page.wait_for_function(
+                        _LOGGED_IN_JS, arg=_PROFILE_INDICATORS,
+                        polling=250, timeout=max_wait * 1000,
+                    )
+                except PlaywrightTimeoutError:
+                    return False, "Login timeout. Please try again."
+
+                print("[TIKTOK] Login detected! Saving session...")
+                _save_tiktok_session(context, session_dir)
+                return True, "TikTok login successful! Session saved."
 
             finally:
                 browser.close()
@@ -125,6 +108,9 @@ class TikTokAuthService:
         self.session_dir.mkdir(exist_ok=True)
         self.session_file = self.session_dir / self.SESSION_FILE
         self.storage_state_file = self.session_dir / self.STORAGE_STATE_FILE
+        # (mtime_ns, size) of session_file and its (logged_in, expires_at,
+        # expires_at as a POSIX timestamp)
+        self._session_cache: Optional[Tuple[Tuple[int, int], tuple]] = None
 
     def login_manual(self) -> Tuple[bool, str]:
         """
@@ -144,22 +130,36 @@ class TikTokAuthService:
         Returns:
             Tuple of (has_session, expires_at)
         """
-        if not self.session_file.exists() or not self.storage_state_file.exists():
+        if not self.storage_state_file.exists():
+            return False, None
+        try:
+            stat = self.session_file.stat()
+        except OSError:
             return False, None
 
         try:
-            with open(self.session_file, "r") as f:
-                session_data = json.load(f)
+            # Reparse only when the file was rewritten; expiry is still
+            # checked on every call, against the cached timestamp
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._session_cache is not None and self._session_cache[0] == key:
+                logged_in, expires_at_str, expires_ts = self._session_cache[1]
+            else:
+                session_data = read_json_file(self.session_file)
+                logged_in = session_data.get("logged_in", False)
+                expires_at_str = session_data.get("expires_at")
+                expires_ts = (
+                    datetime.fromisoformat(expires_at_str).timestamp()
+                    if expires_at_str else None
+                )
+                self._session_cache = (key, (logged_in, expires_at_str, expires_ts))
 
-            expires_at_str = session_data.get("expires_at")
-            if expires_at_str:
-                expires_at = datetime.fromisoformat(expires_at_str)
-                if datetime.now() > expires_at:
+            if expires_ts is not None:
+                if time.time() > expires_ts:
                     self.logger.info("TikTok session expired")
                     return False, None
                 return True, expires_at_str
 
-            return session_data.get("logged_in", False), None
+            return logged_in, None
 
         except Exception as e:
             self.logger.warning(f"Error checking TikTok session: {e}")
@@ -167,13 +167,13 @@ class TikTokAuthService:
 
     def get_storage_state_path(self) -> Optional[str]:
         """Get path to storage state file if session is valid."""
+        # has_valid_session already requires the storage state file
         has_session, _ = self.has_valid_session()
-        if has_session and self.storage_state_file.exists():
-            return str(self.storage_state_file)
-        return None
+        return str(self.storage_state_file) if has_session else None
 
     def clear_session(self) -> None:
         """Clear TikTok session."""
+        self._session_cache = None
         if self.session_file.exists():
             self.session_file.unlink()
         if self.storage_state_file.exists():
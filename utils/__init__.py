@@ -1,3 +1,23 @@
-from .helpers import retry_async, clean_html, truncate_string
+from .helpers import (
+    retry_async,
+    AsyncRateLimiter,
+    clean_html,
+    truncate_string,
+    json_loads,
+    json_dumps,
+    read_json_file,
+    atomic_write_bytes,
+    write_json_file,
+)
 
-__all__ = ["retry_async", "clean_html", "truncate_string"]
+__all__ = [
+    "retry_async",
+    "AsyncRateLimiter",
+    "clean_html",
+    "truncate_string",
+    "json_loads",
+    "json_dumps",
+    "read_json_file",
+    "atomic_write_bytes",
+    "write_json_file",
+]
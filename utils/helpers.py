@@ -1,19 +1,85 @@
 import asyncio
+import json
+import os
 import re
+import tempfile
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from pathlib import Path
+from typing import Callable, TypeVar, Any, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
 from bs4 import BeautifulSoup
 
 from config.logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # selectolax is optional; fall back to BeautifulSoup
+    HTMLParser = None
+
 T = TypeVar("T")
 
+# Patterns used by the string helpers below, compiled once at import.
+# Blank-line runs or space/tab runs, collapsed in one pass by clean_html
+_RE_EXCESS_WHITESPACE = re.compile(r"\n\s*\n|[ \t]+")
+_RE_DIGITS = re.compile(r"(\d+)")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, stringifying unknown types."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str, ensure_ascii=False).encode("utf-8")
+
+
+def read_json_file(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Write data to path through a temp file, so readers never see a partial file.
+
+    Each call gets its own temp file, so concurrent writers of the same path
+    cannot rename each other's half-written data into place.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def write_json_file(path: Union[str, Path], obj: Any) -> None:
+    """Atomically write obj to path as compact JSON."""
+    atomic_write_bytes(path, json_dumps(obj))
+
 
 def retry_async(
     max_retries: int = 3,
     delay_seconds: float = 1.0,
     backoff_factor: float = 2.0,
     exceptions: tuple = (Exception,),
+    total_timeout: Optional[float] = None,
 ):
     """
     Decorator for retrying async functions with exponential backoff.
@@ -23,30 +89,45 @@ def retry_async(
         delay_seconds: Initial delay between retries.
         backoff_factor: Multiplier for delay after each retry.
         exceptions: Tuple of exceptions to catch and retry.
+        total_timeout: Optional cap in seconds on all attempts and delays
+            together; a running attempt is cancelled when it is reached.
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        logger = get_logger()
+        name = func.__name__
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
-            logger = get_logger()
             last_exception = None
             current_delay = delay_seconds
+            loop = asyncio.get_running_loop()
+            deadline = None if total_timeout is None else loop.time() + total_timeout
 
             for attempt in range(max_retries + 1):
                 try:
-                    return await func(*args, **kwargs)
+                    if deadline is None:
+                        return await func(*args, **kwargs)
+                    return await asyncio.wait_for(
+                        func(*args, **kwargs), timeout=max(0.0, deadline - loop.time())
+                    )
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_retries:
+                    out_of_time = (
+                        deadline is not None
+                        and loop.time() + current_delay >= deadline
+                    )
+                    if attempt < max_retries and not out_of_time:
                         logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
+                            f"Attempt {attempt + 1}/{max_retries + 1} failed for {name}: {e}. "
                             f"Retrying in {current_delay:.1f}s..."
                         )
                         await asyncio.sleep(current_delay)
                         current_delay *= backoff_factor
                     else:
                         logger.error(
-                            f"All {max_retries + 1} attempts failed for {func.__name__}: {e}"
+                            f"All {attempt + 1} attempts failed for {name}: {e}"
                         )
+                        break
 
             raise last_exception
 
@@ -54,6 +135,60 @@ def retry_async(
     return decorator
 
 
+class AsyncRateLimiter:
+    """
+    Token bucket limiting how often an async block may start.
+
+    Up to burst entries pass at once, then one more every interval seconds.
+    Use as ``async with limiter:`` or ``await limiter.acquire()``.
+
+    Args:
+        interval: Seconds per token; 0 disables limiting.
+        burst: Bucket size, the number of entries allowed back to back.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = max(0.0, interval)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = None
+        self._lock = None
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if not self.interval:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._updated is not None:
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) / self.interval
+                )
+            self._updated = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.interval)
+                self._tokens = 1.0
+                self._updated = loop.time()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def _collapse_whitespace(match: "re.Match") -> str:
+    """Replacement for _RE_EXCESS_WHITESPACE matches."""
+    return "\n\n" if match.group()[0] == "\n" else " "
+
+
 def clean_html(html: str) -> str:
     """
     Clean HTML content by removing scripts, styles, and excessive whitespace.
@@ -64,18 +199,19 @@ def clean_html(html: str) -> str:
     Returns:
         Cleaned HTML string.
     """
-    soup = BeautifulSoup(html, "lxml")
-
     # Remove script and style elements
-    for element in soup(["script", "style", "noscript"]):
-        element.decompose()
-
-    # Get cleaned HTML
-    cleaned = str(soup)
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        tree.strip_tags(["script", "style", "noscript"])
+        cleaned = tree.html or ""
+    else:
+        soup = BeautifulSoup(html, "lxml")
+        for element in soup(["script", "style", "noscript"]):
+            element.decompose()
+        cleaned = str(soup)
 
     # Remove excessive whitespace
-    cleaned = re.sub(r"\n\s*\n", "\n\n", cleaned)
-    cleaned = re.sub(r"[ \t]+", " ", cleaned)
+    cleaned = _RE_EXCESS_WHITESPACE.sub(_collapse_whitespace, cleaned)
 
     return cleaned.strip()
 
@@ -107,8 +243,7 @@ def extract_domain(url: str) -> str:
     Returns:
         Domain string.
     """
-    match = re.search(r"https?://([^/]+)", url)
-    return match.group(1) if match else ""
+    return urlsplit(url).hostname or ""
 
 
 def normalize_url(url: str) -> str:
@@ -121,11 +256,9 @@ def normalize_url(url: str) -> str:
     Returns:
         Normalized URL.
     """
-    # Remove query string and fragment
-    url = re.sub(r"[?#].*$", "", url)
-    # Remove trailing slash
-    url = url.rstrip("/")
-    return url
+    # Drop query string and fragment, and the path's trailing slash
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), "", ""))
 
 
 def parse_read_time(text: str) -> int:
@@ -138,5 +271,5 @@ def parse_read_time(text: str) -> int:
     Returns:
         Number of minutes as integer.
     """
-    match = re.search(r"(\d+)", text)
+    match = _RE_DIGITS.search(text)
     return int(match.group(1)) if match else 0